@@ -29,76 +29,70 @@ public class DaprPubSubController : ControllerBase
         string queueId,
         [FromBody] ApiRegisterDaprPubSubSinkRequest request)
     {
-        try
+        _logger.LogDebug("RegisterDaprPubSubSink request for queue {QueueId}, pubsub={PubSubName}, topic={Topic}", queueId, request.PubSubName, request.Topic);
+
+        // Validate PubSubName
+        if (string.IsNullOrWhiteSpace(request.PubSubName))
+        {
+            return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
+                false,
+                "PubSubName cannot be empty"
+            ));
+        }
+
+        // Validate Topic
+        if (string.IsNullOrWhiteSpace(request.Topic))
+        {
+            return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
+                false,
+                "Topic cannot be empty"
+            ));
+        }
+
+        // Validate MaxConcurrency
+        if (request.MaxConcurrency < 1 || request.MaxConcurrency > 100)
         {
-            // Validate PubSubName
-            if (string.IsNullOrWhiteSpace(request.PubSubName))
-            {
-                return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
-                    false,
-                    "PubSubName cannot be empty"
-                ));
-            }
-
-            // Validate Topic
-            if (string.IsNullOrWhiteSpace(request.Topic))
-            {
-                return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
-                    false,
-                    "Topic cannot be empty"
-                ));
-            }
-
-            // Validate MaxConcurrency
-            if (request.MaxConcurrency < 1 || request.MaxConcurrency > 100)
-            {
-                return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
-                    false,
-                    "MaxConcurrency must be between 1 and 100"
-                ));
-            }
-
-            // Validate LockTtlSeconds
-            if (request.LockTtlSeconds < 1 || request.LockTtlSeconds > 300)
-            {
-                return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
-                    false,
-                    "LockTtlSeconds must be between 1 and 300"
-                ));
-            }
-
-            // Calculate sink actor ID
-            string sinkActorId = $"{queueId}-pubsub-sink";
-            var sinkActorId_ActorId = new ActorId(sinkActorId);
-
-            // Build InitializeDaprPubSubSinkRequest (dynamic polling starts at 1s)
-            var initRequest = new InitializeDaprPubSubSinkRequest
-            {
-                PubSubName = request.PubSubName,
-                Topic = request.Topic,
-                RawPayload = request.RawPayload,
-                QueueActorId = queueId,
-                MaxConcurrency = request.MaxConcurrency,
-                LockTtlSeconds = request.LockTtlSeconds
-            };
-
-            // Initialize DaprPubSubSinkActor (registers reminder, starts polling)
-            await _daprPubSubSinkActorInvoker.InvokeMethodAsync(
-                sinkActorId_ActorId,
-                ActorMethodNames.InitializeDaprPubSubSink,
-                initRequest);
-
-            return Ok(new ApiRegisterDaprPubSubSinkResponse(
-                true,
-                "DaprPubSub sink registered successfully",
-                DaprPubSubSinkActorId: sinkActorId
+            return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
+                false,
+                "MaxConcurrency must be between 1 and 100"
             ));
         }
-        catch (Exception ex)
+
+        // Validate LockTtlSeconds
+        if (request.LockTtlSeconds < 1 || request.LockTtlSeconds > 300)
         {
-            _logger.LogError(ex, $"Error registering DaprPubSub sink for {queueId}");
-            return StatusCode(500, new ApiErrorResponse($"Internal error: {ex.Message}"));
+            return BadRequest(new ApiRegisterDaprPubSubSinkResponse(
+                false,
+                "LockTtlSeconds must be between 1 and 300"
+            ));
         }
+
+        // Calculate sink actor ID
+        string sinkActorId = $"{queueId}-pubsub-sink";
+        var sinkActorId_ActorId = new ActorId(sinkActorId);
+
+        // Build InitializeDaprPubSubSinkRequest (dynamic polling starts at 1s)
+        var initRequest = new InitializeDaprPubSubSinkRequest
+        {
+            PubSubName = request.PubSubName,
+            Topic = request.Topic,
+            RawPayload = request.RawPayload,
+            QueueActorId = queueId,
+            MaxConcurrency = request.MaxConcurrency,
+            LockTtlSeconds = request.LockTtlSeconds
+        };
+
+        // Initialize DaprPubSubSinkActor (registers reminder, starts polling)
+        await _daprPubSubSinkActorInvoker.InvokeMethodAsync(
+            sinkActorId_ActorId,
+            ActorMethodNames.InitializeDaprPubSubSink,
+            initRequest);
+
+        return Ok(new ApiRegisterDaprPubSubSinkResponse(
+            true,
+            "DaprPubSub sink registered successfully",
+            DaprPubSubSinkActorId: sinkActorId
+        ));
     }
 
     /// <summary>
@@ -107,26 +101,20 @@ public class DaprPubSubController : ControllerBase
     [HttpPost("{queueId}/sink/pubsub/unregister")]
     public async Task<IActionResult> UnregisterDaprPubSubSink(string queueId)
     {
-        try
-        {
-            // Calculate sink actor ID
-            string sinkActorId = $"{queueId}-pubsub-sink";
-            var sinkActorId_ActorId = new ActorId(sinkActorId);
-
-            // Uninitialize DaprPubSubSinkActor (unregisters reminder)
-            await _daprPubSubSinkActorInvoker.InvokeMethodAsync(
-                sinkActorId_ActorId,
-                ActorMethodNames.UninitializeDaprPubSubSink);
-
-            return Ok(new ApiUnregisterDaprPubSubSinkResponse(
-                true,
-                "DaprPubSub sink unregistered successfully"
-            ));
-        }
-        catch (Exception ex)
-        {
-            _logger.LogError(ex, $"Error unregistering DaprPubSub sink for {queueId}");
-            return StatusCode(500, new ApiErrorResponse($"Internal error: {ex.Message}"));
-        }
+        _logger.LogDebug("UnregisterDaprPubSubSink request for queue {QueueId}", queueId);
+
+        // Calculate sink actor ID
+        string sinkActorId = $"{queueId}-pubsub-sink";
+        var sinkActorId_ActorId = new ActorId(sinkActorId);
+
+        // Uninitialize DaprPubSubSinkActor (unregisters reminder)
+        await _daprPubSubSinkActorInvoker.InvokeMethodAsync(
+            sinkActorId_ActorId,
+            ActorMethodNames.UninitializeDaprPubSubSink);
+
+        return Ok(new ApiUnregisterDaprPubSubSinkResponse(
+            true,
+            "DaprPubSub sink unregistered successfully"
+        ));
     }
 }
@@ -0,0 +1,35 @@
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Mvc.Filters;
+using DaprMQ.ApiServer.Models;
+
+namespace DaprMQ.ApiServer.Filters;
+
+/// <summary>
+/// Maps unhandled controller exceptions to HTTP 500 with an ApiErrorResponse body.
+/// Registered globally so controller actions don't each need their own try/catch.
+/// </summary>
+public sealed class ApiExceptionFilter : IExceptionFilter
+{
+    private readonly ILogger<ApiExceptionFilter> _logger;
+
+    public ApiExceptionFilter(ILogger<ApiExceptionFilter> logger)
+    {
+        _logger = logger;
+    }
+
+    public void OnException(ExceptionContext context)
+    {
+        var queueId = context.RouteData.Values.TryGetValue("queueId", out var value) ? value : null;
+        _logger.LogError(
+            context.Exception,
+            "Error handling {Action} for queue {QueueId}",
+            context.ActionDescriptor.DisplayName,
+            queueId);
+
+        context.Result = new ObjectResult(new ApiErrorResponse($"Internal error: {context.Exception.Message}"))
+        {
+            StatusCode = StatusCodes.Status500InternalServerError
+        };
+        context.ExceptionHandled = true;
+    }
+}
@@ -0,0 +1,32 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace DaprMQ.ApiServer.Models;
+
+/// <summary>
+/// Source-generated serialization metadata for the REST API models.
+/// Registered first in the MVC resolver chain so request bodies are bound and
+/// responses written without reflection-based metadata.
+/// </summary>
+[JsonSourceGenerationOptions(JsonSerializerDefaults.Web)]
+[JsonSerializable(typeof(ApiPushRequest))]
+[JsonSerializable(typeof(ApiAcknowledgeRequest))]
+[JsonSerializable(typeof(ApiExtendLockRequest))]
+[JsonSerializable(typeof(ApiDeadLetterRequest))]
+[JsonSerializable(typeof(ApiRegisterHttpSinkRequest))]
+[JsonSerializable(typeof(ApiRegisterDaprPubSubSinkRequest))]
+[JsonSerializable(typeof(ApiPushResponse))]
+[JsonSerializable(typeof(ApiPopResponse))]
+[JsonSerializable(typeof(ApiPopWithAckResponse))]
+[JsonSerializable(typeof(ApiAcknowledgeResponse))]
+[JsonSerializable(typeof(ApiExtendLockResponse))]
+[JsonSerializable(typeof(ApiDeadLetterResponse))]
+[JsonSerializable(typeof(ApiLockedResponse))]
+[JsonSerializable(typeof(ApiErrorResponse))]
+[JsonSerializable(typeof(ApiRegisterHttpSinkResponse))]
+[JsonSerializable(typeof(ApiUnregisterHttpSinkResponse))]
+[JsonSerializable(typeof(ApiRegisterDaprPubSubSinkResponse))]
+[JsonSerializable(typeof(ApiUnregisterDaprPubSubSinkResponse))]
+public partial class ApiJsonSerializerContext : JsonSerializerContext
+{
+}
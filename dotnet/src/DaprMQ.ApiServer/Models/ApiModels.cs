@@ -1,4 +1,7 @@
+using System.Buffers;
+using System.Text;
 using System.Text.Json;
+using System.Text.Json.Serialization;
 
 namespace DaprMQ.ApiServer.Models;
 
@@ -34,7 +37,7 @@ public record ApiPopResponse(
 );
 
 public record ApiPopItem(
-    object Item,
+    RawJson Item,
     int Priority
 );
 
@@ -45,7 +48,7 @@ public record ApiPopWithAckResponse(
 );
 
 public record ApiPopWithAckItem(
-    object Item,
+    RawJson Item,
     int Priority,
     string LockId,
     double LockExpiresAt,
@@ -59,6 +62,45 @@ public record ApiAcknowledgeResponse(
     string? ErrorCode = null
 );
 
+/// <summary>
+/// Item JSON exactly as stored by the queue actor.
+/// </summary>
+[JsonConverter(typeof(RawJsonConverter))]
+public readonly record struct RawJson(string Json)
+{
+    /// <summary>
+    /// Wraps stored item JSON after checking it is a single well-formed JSON value.
+    /// The converter writes the text verbatim, so a bad item must fail here, inside the
+    /// controller action, where ApiExceptionFilter can still turn it into a 500.
+    /// </summary>
+    /// <exception cref="JsonException">The text is not a single valid JSON value.</exception>
+    public static RawJson Parse(string json)
+    {
+        var buffer = ArrayPool<byte>.Shared.Rent(Encoding.UTF8.GetMaxByteCount(json.Length));
+        try
+        {
+            // Skip over the value without building a document; the reader throws on malformed input
+            var reader = new Utf8JsonReader(buffer.AsSpan(0, Encoding.UTF8.GetBytes(json, buffer)));
+            if (!reader.Read())
+            {
+                throw new JsonException("Item JSON is empty.");
+            }
+
+            reader.Skip();
+            if (reader.Read())
+            {
+                throw new JsonException("Item JSON has trailing content.");
+            }
+
+            return new RawJson(json);
+        }
+        finally
+        {
+            ArrayPool<byte>.Shared.Return(buffer);
+        }
+    }
+}
+
 public record ApiErrorResponse(
     string Message,
     bool Success = false
@@ -0,0 +1,22 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace DaprMQ.ApiServer.Models;
+
+/// <summary>
+/// Writes a <see cref="RawJson"/> payload to the response verbatim, so item JSON
+/// stored by the actor is not parsed into a DOM and re-encoded on the way out.
+/// </summary>
+public sealed class RawJsonConverter : JsonConverter<RawJson>
+{
+    public override RawJson Read(ref Utf8JsonReader reader, Type typeToConvert, JsonSerializerOptions options)
+    {
+        using var document = JsonDocument.ParseValue(ref reader);
+        return new RawJson(document.RootElement.GetRawText());
+    }
+
+    public override void Write(Utf8JsonWriter writer, RawJson value, JsonSerializerOptions options)
+    {
+        writer.WriteRawValue(value.Json);
+    }
+}
@@ -1,6 +1,11 @@
 using System.Text.Json;
 using System.Text.Json.Serialization;
+using System.Text.Json.Serialization.Metadata;
+using Microsoft.AspNetCore.Mvc.ModelBinding.Metadata;
 using Microsoft.AspNetCore.Server.Kestrel.Core;
+using Microsoft.OpenApi;
+using DaprMQ.ApiServer.Filters;
+using DaprMQ.ApiServer.Models;
 using DaprMQ.ApiServer.Services;
 using DaprMQ.Interfaces;
 
@@ -54,7 +59,20 @@ builder.Services.AddCors(options =>
 });
 
 // Add services to the container
-builder.Services.AddControllers().AddDapr();
+builder.Services.AddControllers(options =>
+    {
+        // Unhandled controller exceptions become 500 + ApiErrorResponse
+        options.Filters.Add<ApiExceptionFilter>();
+
+        // Push items carry no validation attributes and their payload is opaque JSON;
+        // skip walking them so model validation doesn't visit every item of a 1000-item push
+        options.ModelMetadataDetailsProviders.Add(new SuppressChildValidationMetadataProvider(typeof(ApiPushItem)));
+        options.ModelMetadataDetailsProviders.Add(new SuppressChildValidationMetadataProvider(typeof(JsonElement)));
+    })
+    // Source-generated metadata for API models is consulted first; reflection remains the fallback
+    .AddJsonOptions(options =>
+        options.JsonSerializerOptions.TypeInfoResolverChain.Insert(0, ApiJsonSerializerContext.Default))
+    .AddDapr();
 
 // Add Dapr Client services globally (required for IActorProxyFactory used by gRPC)
 builder.Services.AddDaprClient();
@@ -87,6 +105,9 @@ builder.Services.AddSingleton<IQueueActorInvoker>(sp =>
         sp.GetRequiredService<Dapr.Actors.Client.IActorProxyFactory>(),
         actorConfig.QueueActorTypeName));
 
+// Coalesces concurrent HTTP pushes to the same queue into one actor call
+builder.Services.AddSingleton<QueuePushBatcher>();
+
 // Register HttpSinkActor invoker (dedicated invoker for HttpSinkActor operations)
 builder.Services.AddSingleton<IHttpSinkActorInvoker>(sp =>
     new HttpSinkActorInvoker(
@@ -104,6 +125,9 @@ builder.Services.AddEndpointsApiExplorer();
 builder.Services.AddSwaggerGen(c =>
 {
     c.SwaggerDoc("v1", new() { Title = "DaprMQ API (.NET)", Version = "v1" });
+
+    // Items are returned as the stored JSON value, not as a wrapper object; an empty schema means any JSON value
+    c.MapType<RawJson>(() => new OpenApiSchema());
 });
 
 // Register actors (conditionally based on environment variable)
@@ -122,7 +146,11 @@ if (registerActors)
         {
             PropertyNamingPolicy = JsonNamingPolicy.CamelCase, // Use camelCase instead of PascalCase
             DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull, // Skip null properties
-            WriteIndented = false // Set to true only for debugging
+            WriteIndented = false, // Set to true only for debugging
+            // Source-generated metadata for actor state; reflection covers everything else (method payloads)
+            TypeInfoResolver = JsonTypeInfoResolver.Combine(
+                DaprMQ.ActorStateJsonSerializerContext.Default,
+                new DefaultJsonTypeInfoResolver())
         };
     });
 }
@@ -47,7 +47,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
                 }
             }
 
-            _logger.LogDebug($"gRPC Push request for queue {request.QueueId} with {request.Items.Count} items");
+            _logger.LogDebug("gRPC Push request for queue {QueueId} with {ItemCount} items", request.QueueId, request.Items.Count);
 
             var actorId = new ActorId(request.QueueId);
 
@@ -85,7 +85,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Error pushing items to queue {request.QueueId}");
+            _logger.LogError(ex, "Error pushing items to queue {QueueId}", request.QueueId);
             throw new RpcException(new Status(StatusCode.Internal, $"Internal error: {ex.Message}"));
         }
     }
@@ -103,7 +103,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
                 throw new RpcException(new Status(StatusCode.InvalidArgument, "Count must be between 1 and 100"));
             }
 
-            _logger.LogDebug($"gRPC Pop request for queue {request.QueueId}, count={count}");
+            _logger.LogDebug("gRPC Pop request for queue {QueueId}, count={Count}", request.QueueId, count);
 
             var actorId = new ActorId(request.QueueId);
 
@@ -161,7 +161,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Error popping item from queue {request.QueueId}");
+            _logger.LogError(ex, "Error popping item from queue {QueueId}", request.QueueId);
             throw new RpcException(new Status(StatusCode.Internal, $"Internal error: {ex.Message}"));
         }
     }
@@ -179,7 +179,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
                 throw new RpcException(new Status(StatusCode.InvalidArgument, "Count must be between 1 and 100"));
             }
 
-            _logger.LogDebug($"gRPC PopWithAck request for queue {request.QueueId}, ttl={request.TtlSeconds}s, allow_competing_consumers={request.AllowCompetingConsumers}, count={count}");
+            _logger.LogDebug("gRPC PopWithAck request for queue {QueueId}, ttl={TtlSeconds}s, allow_competing_consumers={AllowCompetingConsumers}, count={Count}", request.QueueId, request.TtlSeconds, request.AllowCompetingConsumers, count);
 
             var actorId = new ActorId(request.QueueId);
 
@@ -245,7 +245,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Error popping with ack from queue {request.QueueId}");
+            _logger.LogError(ex, "Error popping with ack from queue {QueueId}", request.QueueId);
             throw new RpcException(new Status(StatusCode.Internal, $"Internal error: {ex.Message}"));
         }
     }
@@ -254,7 +254,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
     {
         try
         {
-            _logger.LogDebug($"gRPC Acknowledge request for queue {request.QueueId}, lockId={request.LockId}");
+            _logger.LogDebug("gRPC Acknowledge request for queue {QueueId}, lockId={LockId}", request.QueueId, request.LockId);
 
             var actorId = new ActorId(request.QueueId);
 
@@ -294,7 +294,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Error acknowledging item in queue {request.QueueId}");
+            _logger.LogError(ex, "Error acknowledging item in queue {QueueId}", request.QueueId);
             throw new RpcException(new Status(StatusCode.Internal, $"Internal error: {ex.Message}"));
         }
     }
@@ -303,7 +303,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
     {
         try
         {
-            _logger.LogDebug($"gRPC ExtendLock request for queue {request.QueueId}, lockId={request.LockId}");
+            _logger.LogDebug("gRPC ExtendLock request for queue {QueueId}, lockId={LockId}", request.QueueId, request.LockId);
 
             var actorId = new ActorId(request.QueueId);
 
@@ -344,7 +344,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Error extending lock in queue {request.QueueId}");
+            _logger.LogError(ex, "Error extending lock in queue {QueueId}", request.QueueId);
             throw new RpcException(new Status(StatusCode.Internal, $"Internal error: {ex.Message}"));
         }
     }
@@ -353,7 +353,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
     {
         try
         {
-            _logger.LogDebug($"gRPC DeadLetter request for queue {request.QueueId}, lockId={request.LockId}");
+            _logger.LogDebug("gRPC DeadLetter request for queue {QueueId}, lockId={LockId}", request.QueueId, request.LockId);
 
             var actorId = new ActorId(request.QueueId);
 
@@ -393,7 +393,7 @@ public class DaprMQGrpcService : Grpc.DaprMQ.DaprMQBase
         }
         catch (Exception ex)
         {
-            _logger.LogError(ex, $"Error moving item to dead letter queue in {request.QueueId}");
+            _logger.LogError(ex, "Error moving item to dead letter queue in {QueueId}", request.QueueId);
             throw new RpcException(new Status(StatusCode.Internal, $"Internal error: {ex.Message}"));
         }
     }
@@ -0,0 +1,190 @@
+using System.Collections.Concurrent;
+using Dapr.Actors;
+using DaprMQ.ApiServer.Constants;
+using DaprMQ.Interfaces;
+
+namespace DaprMQ.ApiServer.Services;
+
+/// <summary>
+/// Coalesces concurrent push requests for the same queue into a single actor call.
+/// Batching is opportunistic: a lone push is sent immediately, and pushes that
+/// arrive while a call for their queue is in flight are combined into the next one.
+/// </summary>
+public sealed class QueuePushBatcher
+{
+    /// <summary>
+    /// Maximum items per actor Push call (matches the actor's own limit).
+    /// </summary>
+    public const int MaxItemsPerBatch = 1000;
+
+    private readonly IQueueActorInvoker _actorInvoker;
+    private readonly ConcurrentDictionary<string, QueueBatch> _batches = new();
+
+    public QueuePushBatcher(IQueueActorInvoker actorInvoker)
+    {
+        _actorInvoker = actorInvoker;
+    }
+
+    /// <summary>
+    /// Push items to a queue, sharing the actor call with any concurrent pushes to it.
+    /// The response reports only this caller's items.
+    /// </summary>
+    public Task<PushResponse> PushAsync(string queueId, List<PushItem> items)
+    {
+        // Build the actor id up front so an invalid queue id fails this caller
+        // synchronously instead of faulting the background flush
+        var actorId = new ActorId(queueId);
+        var pending = new PendingPush(items);
+
+        while (true)
+        {
+            var batch = _batches.GetOrAdd(queueId, static _ => new QueueBatch());
+            bool startFlush;
+
+            lock (batch)
+            {
+                // A batch that went idle and was evicted must not accept new work
+                if (batch.Evicted)
+                {
+                    continue;
+                }
+
+                batch.Pending.Add(pending);
+                startFlush = !batch.Flushing;
+                batch.Flushing = true;
+            }
+
+            if (startFlush)
+            {
+                _ = Task.Run(() => FlushAsync(queueId, actorId, batch));
+            }
+
+            return pending.Completion.Task;
+        }
+    }
+
+    private async Task FlushAsync(string queueId, ActorId actorId, QueueBatch batch)
+    {
+        List<PendingPush>? pushes = null;
+
+        try
+        {
+            while (true)
+            {
+                lock (batch)
+                {
+                    if (batch.Pending.Count == 0)
+                    {
+                        Evict(queueId, batch);
+                        return;
+                    }
+
+                    pushes = TakeBatch(batch.Pending);
+                }
+
+                var items = new List<PushItem>(pushes.Sum(p => p.Items.Count));
+                foreach (var push in pushes)
+                {
+                    items.AddRange(push.Items);
+                }
+
+                try
+                {
+                    var result = await _actorInvoker.InvokeMethodAsync<PushRequest, PushResponse>(
+                        actorId,
+                        ActorMethodNames.Push,
+                        new PushRequest { Items = items });
+
+                    foreach (var push in pushes)
+                    {
+                        push.Completion.TrySetResult(result.Success
+                            ? result with { ItemsPushed = push.Items.Count }
+                            : result);
+                    }
+                }
+                catch (Exception ex)
+                {
+                    foreach (var push in pushes)
+                    {
+                        push.Completion.TrySetException(ex);
+                    }
+                }
+
+                pushes = null;
+            }
+        }
+        catch (Exception ex)
+        {
+            // Unexpected failure outside the actor call: fail every waiting caller and
+            // evict the batch so later pushes to this queue start a fresh flush
+            List<PendingPush> stranded;
+
+            lock (batch)
+            {
+                stranded = new List<PendingPush>(batch.Pending);
+                batch.Pending.Clear();
+                Evict(queueId, batch);
+            }
+
+            if (pushes != null)
+            {
+                stranded.AddRange(pushes);
+            }
+
+            foreach (var push in stranded)
+            {
+                push.Completion.TrySetException(ex);
+            }
+        }
+    }
+
+    /// <summary>
+    /// Marks an idle batch as evicted and removes it from the queue map. Must be called under the batch lock.
+    /// </summary>
+    private void Evict(string queueId, QueueBatch batch)
+    {
+        batch.Flushing = false;
+        batch.Evicted = true;
+        _batches.TryRemove(new KeyValuePair<string, QueueBatch>(queueId, batch));
+    }
+
+    /// <summary>
+    /// Removes pending pushes from the front of the list, in arrival order, up to
+    /// <see cref="MaxItemsPerBatch"/> items. The first push is always taken.
+    /// </summary>
+    private static List<PendingPush> TakeBatch(List<PendingPush> pending)
+    {
+        var taken = 1;
+        var itemCount = pending[0].Items.Count;
+
+        while (taken < pending.Count && itemCount + pending[taken].Items.Count <= MaxItemsPerBatch)
+        {
+            itemCount += pending[taken].Items.Count;
+            taken++;
+        }
+
+        var batch = pending.GetRange(0, taken);
+        pending.RemoveRange(0, taken);
+        return batch;
+    }
+
+    private sealed class QueueBatch
+    {
+        public List<PendingPush> Pending { get; } = new();
+        public bool Flushing { get; set; }
+        public bool Evicted { get; set; }
+    }
+
+    private sealed class PendingPush
+    {
+        public PendingPush(List<PushItem> items)
+        {
+            Items = items;
+        }
+
+        public List<PushItem> Items { get; }
+
+        public TaskCompletionSource<PushResponse> Completion { get; } =
+            new(TaskCreationOptions.RunContinuationsAsynchronously);
+    }
+}
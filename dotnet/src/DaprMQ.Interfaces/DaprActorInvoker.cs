@@ -1,3 +1,4 @@
+using System.Collections.Concurrent;
 using Dapr.Actors;
 using Dapr.Actors.Client;
 
@@ -6,25 +7,45 @@ namespace DaprMQ.Interfaces;
 /// <summary>
 /// Implementation of IQueueActorInvoker that uses Dapr's ActorProxy.
 /// This wrapper enables unit testing by providing a mockable interface.
+/// Proxies are cached per actor id so hot queues don't rebuild one per request.
 /// </summary>
 public class QueueActorInvoker : IQueueActorInvoker
 {
+    /// <summary>
+    /// Default upper bound on cached proxies, so unbounded queue ids (e.g. load tests)
+    /// can't grow the cache without limit.
+    /// </summary>
+    private const int DefaultMaxCachedProxies = 10_000;
+
     private readonly IActorProxyFactory _actorProxyFactory;
     private readonly string _actorType;
+    private readonly int _maxCachedProxies;
+    private readonly ConcurrentDictionary<string, ActorProxy> _proxies = new();
+
+    // Tracked separately because ConcurrentDictionary.Count takes every bucket lock
+    private int _cachedProxyCount;
 
     public QueueActorInvoker(IActorProxyFactory actorProxyFactory, string actorType)
+        : this(actorProxyFactory, actorType, DefaultMaxCachedProxies)
+    {
+    }
+
+    internal QueueActorInvoker(IActorProxyFactory actorProxyFactory, string actorType, int maxCachedProxies)
     {
         _actorProxyFactory = actorProxyFactory;
         _actorType = actorType;
+        _maxCachedProxies = maxCachedProxies;
     }
 
+    internal int CachedProxyCount => Volatile.Read(ref _cachedProxyCount);
+
     /// <inheritdoc />
     public async Task<TResponse> InvokeMethodAsync<TResponse>(
         ActorId actorId,
         string methodName,
         CancellationToken cancellationToken = default)
     {
-        var proxy = _actorProxyFactory.Create(actorId, _actorType);
+        var proxy = GetProxy(actorId);
         return await proxy.InvokeMethodAsync<TResponse>(methodName, cancellationToken);
     }
 
@@ -35,7 +56,7 @@ public class QueueActorInvoker : IQueueActorInvoker
         TRequest request,
         CancellationToken cancellationToken = default)
     {
-        var proxy = _actorProxyFactory.Create(actorId, _actorType);
+        var proxy = GetProxy(actorId);
         return await proxy.InvokeMethodAsync<TRequest, TResponse>(methodName, request, cancellationToken);
     }
 
@@ -46,7 +67,7 @@ public class QueueActorInvoker : IQueueActorInvoker
         TRequest request,
         CancellationToken cancellationToken = default)
     {
-        var proxy = _actorProxyFactory.Create(actorId, _actorType);
+        var proxy = GetProxy(actorId);
         await proxy.InvokeMethodAsync(methodName, request, cancellationToken);
     }
 
@@ -56,7 +77,47 @@ public class QueueActorInvoker : IQueueActorInvoker
         string methodName,
         CancellationToken cancellationToken = default)
     {
-        var proxy = _actorProxyFactory.Create(actorId, _actorType);
+        var proxy = GetProxy(actorId);
         await proxy.InvokeMethodAsync(methodName, cancellationToken);
     }
+
+    internal ActorProxy GetProxy(ActorId actorId)
+    {
+        var id = actorId.GetId();
+        if (_proxies.TryGetValue(id, out var proxy))
+        {
+            return proxy;
+        }
+
+        proxy = _actorProxyFactory.Create(actorId, _actorType);
+        if (!_proxies.TryAdd(id, proxy))
+        {
+            // Another caller cached a proxy for this id first; share theirs
+            return _proxies.TryGetValue(id, out var existing) ? existing : proxy;
+        }
+
+        if (Interlocked.Increment(ref _cachedProxyCount) > _maxCachedProxies)
+        {
+            EvictOne(id);
+        }
+
+        return proxy;
+    }
+
+    /// <summary>
+    /// Removes a single cached proxy other than <paramref name="keepId"/>. Evicting one entry
+    /// at a time keeps the rest of the hot proxies cached, unlike clearing the whole table.
+    /// </summary>
+    private void EvictOne(string keepId)
+    {
+        // Enumerating a ConcurrentDictionary is lock-free (unlike Keys/Count)
+        foreach (var entry in _proxies)
+        {
+            if (entry.Key != keepId && _proxies.TryRemove(entry.Key, out _))
+            {
+                Interlocked.Decrement(ref _cachedProxyCount);
+                return;
+            }
+        }
+    }
 }
@@ -0,0 +1,21 @@
+using System.Text.Json.Serialization;
+using DaprMQ.Interfaces;
+
+namespace DaprMQ;
+
+/// <summary>
+/// Source-generated serialization metadata for actor state.
+/// Options mirror the actor runtime's JsonSerializerOptions so persisted state keeps the same shape.
+/// </summary>
+[JsonSourceGenerationOptions(
+    PropertyNamingPolicy = JsonKnownNamingPolicy.CamelCase,
+    DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull)]
+[JsonSerializable(typeof(ActorMetadata))]
+[JsonSerializable(typeof(List<QueueSegmentItem>))]
+[JsonSerializable(typeof(LockState))]
+[JsonSerializable(typeof(HttpSinkActorState))]
+[JsonSerializable(typeof(DaprPubSubSinkActorState))]
+[JsonSerializable(typeof(SinkConfig))]
+public partial class ActorStateJsonSerializerContext : JsonSerializerContext
+{
+}
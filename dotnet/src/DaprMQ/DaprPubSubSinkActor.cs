@@ -207,7 +207,7 @@ public class DaprPubSubSinkActor : Actor, IDaprPubSubSinkActor, IRemindable
                 return;
             }
 
-            Logger.LogInformation("DaprPubSubSinkActor {ActorId} polling {Count} items from queue", Id.GetId(), popResult.Items.Count);
+            Logger.LogDebug("DaprPubSubSinkActor {ActorId} polling {Count} items from queue", Id.GetId(), popResult.Items.Count);
 
             // Items found: reset to fast polling (1s)
             nextInterval = 1;
@@ -267,7 +267,7 @@ public class DaprPubSubSinkActor : Actor, IDaprPubSubSinkActor, IRemindable
                 }
             }
 
-            Logger.LogInformation(
+            Logger.LogDebug(
                 "DaprPubSubSinkActor {ActorId} published {Count} items to topic={Topic}",
                 Id.GetId(), popResult.Items.Count, state.Topic);
         }
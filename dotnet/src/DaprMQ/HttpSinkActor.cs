@@ -149,7 +149,7 @@ public class HttpSinkActor : Actor, IHttpSinkActor, IRemindable
                 return;
             }
 
-            Logger.LogInformation("HttpSinkActor {ActorId} polled {Count} items", Id.GetId(), popResult.Items.Count);
+            Logger.LogDebug("HttpSinkActor {ActorId} polled {Count} items", Id.GetId(), popResult.Items.Count);
 
             // Items found: reset to fast polling (1s)
             nextInterval = 1;
@@ -178,7 +178,7 @@ public class HttpSinkActor : Actor, IHttpSinkActor, IRemindable
             if (response.StatusCode == System.Net.HttpStatusCode.OK)
             {
                 // 200 OK - Acknowledge all locks
-                Logger.LogInformation("HttpSinkActor {ActorId} received 200 OK, acknowledging {Count} locks",
+                Logger.LogDebug("HttpSinkActor {ActorId} received 200 OK, acknowledging {Count} locks",
                     Id.GetId(), popResult.Items.Count);
 
                 foreach (var item in popResult.Items)
@@ -201,7 +201,7 @@ public class HttpSinkActor : Actor, IHttpSinkActor, IRemindable
             else if (response.StatusCode == System.Net.HttpStatusCode.Accepted)
             {
                 // 202 Accepted - Endpoint will handle acknowledgement
-                Logger.LogInformation("HttpSinkActor {ActorId} received 202 Accepted, endpoint will handle acks",
+                Logger.LogDebug("HttpSinkActor {ActorId} received 202 Accepted, endpoint will handle acks",
                     Id.GetId());
             }
             else
@@ -1,5 +1,4 @@
 using System.Security.Cryptography;
-using System.Text;
 using Dapr.Actors;
 using Dapr.Actors.Runtime;
 using Microsoft.Extensions.Logging;
@@ -33,6 +32,7 @@ public record MetadataConfig
 public record QueueMetadata
 {
     public int HeadSegment { get; init; }
+    public int HeadIndex { get; init; }  // Items already consumed from the front of the head segment
     public int TailSegment { get; init; }
     public int Count { get; init; }
     public int? HeadOffloadedSegment { get; init; }
@@ -71,18 +71,32 @@ public record LockState
 public class QueueActor : Actor, IQueueActor, IRemindable
 {
     private readonly IQueueActorInvoker _actorInvoker;
+    private readonly ActorId _deadLetterActorId;
 
     private const int MaxSegmentSize = 100;
     private const int MinLockTtlSeconds = 1;
     private const int MaxLockTtlSeconds = 300;
     private const int LockIdLength = 11;
+    private const string LockIdChars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789";
+
+    private const string LockReminderPrefix = "lock-";
 
     private static bool IsQueueCorrupted(ActorMetadata metadata) =>
         !string.IsNullOrEmpty(metadata.ErrorMessage);
 
+    /// <summary>
+    /// State key for a queue segment. Built in one place so every caller uses the same format.
+    /// </summary>
+    private static string SegmentKey(int priority, int segmentNum) => $"queue_{priority}_seg_{segmentNum}";
+
+    private static string LockStateKey(string lockId) => $"{lockId}-lock";
+
+    private static string LockReminderName(string lockId) => LockReminderPrefix + lockId;
+
     public QueueActor(ActorHost host, IQueueActorInvoker queueActorInvoker) : base(host)
     {
         _actorInvoker = queueActorInvoker ?? throw new ArgumentNullException(nameof(queueActorInvoker));
+        _deadLetterActorId = new ActorId($"{Id.GetId()}-deadletter");
     }
 
     /// <summary>
@@ -115,28 +129,26 @@ public class QueueActor : Actor, IQueueActor, IRemindable
     }
 
     /// <summary>
-    /// Internal push that stages changes without committing.
-    /// Returns true if push succeeded, false otherwise.
+    /// Internal push that stages the segment without committing.
+    /// Returns whether the push succeeded and the updated metadata; the caller stages metadata
+    /// once after all pushes so a bulk push doesn't re-read and re-write it per item.
     /// </summary>
-    private async Task<bool> PushInternal(string itemJson, int priority, SinkConfig? sink = null)
+    private async Task<(bool success, ActorMetadata metadata)> PushInternal(ActorMetadata metadata, string itemJson, int priority, SinkConfig? sink = null)
     {
         // Validation
         if (string.IsNullOrEmpty(itemJson))
         {
             Logger.LogWarning("Push failed: ItemJson is empty");
-            return false;
+            return (false, metadata);
         }
 
         if (priority < 0)
         {
-            Logger.LogWarning($"Push failed: priority must be >= 0, got {priority}");
-            return false;
+            Logger.LogWarning("Push failed: priority must be >= 0, got {Priority}", priority);
+            return (false, metadata);
         }
 
-        // Get metadata
-        var metadata = await GetMetadataAsync();
-
-        // Ensure priority queue exists
+        // Ensure priority queue exists (added to metadata together with the pointer update below)
         if (!metadata.Queues.TryGetValue(priority, out var queueMeta))
         {
             queueMeta = new QueueMetadata
@@ -145,7 +157,6 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 TailSegment = 0,
                 Count = 0
             };
-            metadata = metadata with { Queues = new Dictionary<int, QueueMetadata>(metadata.Queues) { [priority] = queueMeta } };
         }
 
         int tailSegment = queueMeta.TailSegment;
@@ -153,17 +164,26 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         int count = queueMeta.Count;
 
         // Get current tail segment
-        string segmentKey = $"queue_{priority}_seg_{tailSegment}";
-        var segment = await StateManager.TryGetStateAsync<Queue<QueueSegmentItem>>(segmentKey);
-        var segmentQueue = segment.HasValue ? segment.Value : new Queue<QueueSegmentItem>();
+        string segmentKey = SegmentKey(priority, tailSegment);
+        var segment = await StateManager.TryGetStateAsync<List<QueueSegmentItem>>(segmentKey);
+        var segmentItems = segment.HasValue ? segment.Value : new List<QueueSegmentItem>();
+
+        // Tail is also the partially consumed head segment: it is being re-written anyway,
+        // so drop the consumed prefix now and free its slots for new items. The head index is
+        // always reset, even if the segment is shorter than it (desync), so the new item stays reachable.
+        if (tailSegment == headSegment && queueMeta.HeadIndex > 0)
+        {
+            segmentItems.RemoveRange(0, Math.Min(queueMeta.HeadIndex, segmentItems.Count));
+            queueMeta = queueMeta with { HeadIndex = 0 };
+        }
 
         // Check if segment is full BEFORE appending
-        if (segmentQueue.Count >= MaxSegmentSize)
+        if (segmentItems.Count >= MaxSegmentSize)
         {
             // Allocate new segment
             tailSegment++;
-            segmentKey = $"queue_{priority}_seg_{tailSegment}";
-            segmentQueue = new Queue<QueueSegmentItem>();
+            segmentKey = SegmentKey(priority, tailSegment);
+            segmentItems = new List<QueueSegmentItem>();
         }
 
         // Append item to segment (FIFO)
@@ -172,7 +192,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             ItemJson = itemJson,
             Sink = sink
         };
-        segmentQueue.Enqueue(segmentItem);
+        segmentItems.Add(segmentItem);
 
         // Update metadata (count and pointers)
         count++;
@@ -184,13 +204,12 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         };
         metadata = metadata with { Queues = new Dictionary<int, QueueMetadata>(metadata.Queues) { [priority] = queueMeta } };
 
-        // Stage segment and metadata (don't commit)
-        await StateManager.SetStateAsync(segmentKey, segmentQueue);
-        await SetMetadataAsync(metadata);
+        // Stage segment (don't commit)
+        await StateManager.SetStateAsync(segmentKey, segmentItems);
 
-        Logger.LogDebug($"Staged push to priority {priority}, count now {count}");
+        Logger.LogDebug("Staged push to priority {Priority}, count now {Count}", priority, count);
 
-        return true;
+        return (true, metadata);
     }
 
     /// <summary>
@@ -223,7 +242,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
             if (request.Items.Count > 1000)
             {
-                Logger.LogWarning($"Push failed: Items count {request.Items.Count} exceeds maximum of 1000");
+                Logger.LogWarning("Push failed: Items count {ItemCount} exceeds maximum of 1000", request.Items.Count);
                 return new PushResponse
                 {
                     Success = false,
@@ -248,7 +267,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
                 if (item.Priority < 0)
                 {
-                    Logger.LogWarning($"Push failed: Priority {item.Priority} must be >= 0");
+                    Logger.LogWarning("Push failed: Priority {Priority} must be >= 0", item.Priority);
                     return new PushResponse
                     {
                         Success = false,
@@ -265,6 +284,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
             int totalPushed = 0;
             var processedPriorities = new HashSet<int>();
+            var metadataBeforePush = metadata;
 
             // Process each priority group
             foreach (var group in groupedItems)
@@ -275,13 +295,14 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 foreach (var item in group)
                 {
                     // Push and stage changes (reuse existing PushInternal)
-                    bool success = await PushInternal(item.ItemJson, priority, item.Sink);
+                    (bool success, metadata) = await PushInternal(metadata, item.ItemJson, priority, item.Sink);
 
                     if (!success)
                     {
-                        // All-or-nothing: if any item fails, rollback not needed
-                        // because SaveStateAsync hasn't been called yet
-                        Logger.LogError($"Push failed for item at priority {priority}");
+                        // All-or-nothing: drop the segments already staged by this push so the
+                        // actor's post-method save cannot persist them without their metadata
+                        Logger.LogError("Push failed for item at priority {Priority}", priority);
+                        await StateManager.ClearCacheAsync();
                         return new PushResponse
                         {
                             Success = false,
@@ -294,13 +315,14 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 }
 
                 // Check and offload segments for this priority (non-blocking, best-effort)
-                await CheckAndOffloadSegmentsAsync(priority, metadata);
+                metadata = await CheckAndOffloadSegmentsAsync(priority, metadata, metadataBeforePush);
             }
 
             // Commit all staged changes atomically (all items across all priorities)
+            await SetMetadataAsync(metadata);
             await StateManager.SaveStateAsync();
 
-            Logger.LogDebug($"Pushed {totalPushed} items across {processedPriorities.Count} priorities");
+            Logger.LogDebug("Pushed {TotalPushed} items across {PriorityCount} priorities", totalPushed, processedPriorities.Count);
 
             return new PushResponse
             {
@@ -316,6 +338,9 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         catch (Exception ex)
         {
             Logger.LogError(ex, "Error in Push");
+            // Segments are staged per item but metadata only once at the end, so discard
+            // the partial push rather than let the post-method save persist it
+            await StateManager.ClearCacheAsync();
             return new PushResponse
             {
                 Success = false,
@@ -350,17 +375,29 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             };
         }
 
-        var items = new List<PopItem>();
+        // Fast path for idle polling: nothing queued and no lock to report, so skip the pop loop entirely
+        if (request.Count > 0 && metadata.LockCount == 0 && metadata.Queues.Count == 0)
+        {
+            return new PopResponse
+            {
+                Items = new List<PopItem>(),
+                Locked = false,
+                IsEmpty = true
+            };
+        }
+
+        var items = new List<PopItem>(request.Count);
+        var originalMetadata = metadata;
 
         // Pop up to Count items
         for (int i = 0; i < request.Count; i++)
         {
-            var (response, priority, itemJson, _) = await PopWithPriorityAsync();
+            (var response, int priority, string? itemJson, _, metadata) = await PopWithPriorityAsync(metadata);
 
             // If locked, return what we have so far with lock info
             if (response.Locked)
             {
-                await StateManager.SaveStateAsync();
+                await CommitPopsAsync(originalMetadata, metadata);
                 return new PopResponse
                 {
                     Items = items,
@@ -374,7 +411,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             // If empty, return what we have so far
             if (response.IsEmpty)
             {
-                await StateManager.SaveStateAsync();
+                await CommitPopsAsync(originalMetadata, metadata);
                 return new PopResponse
                 {
                     Items = items,
@@ -392,7 +429,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         }
 
         // Commit all changes atomically
-        await StateManager.SaveStateAsync();
+        await CommitPopsAsync(originalMetadata, metadata);
 
         return new PopResponse
         {
@@ -402,6 +439,22 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         };
     }
 
+    /// <summary>
+    /// Stage metadata and commit once after a run of pops.
+    /// Every pop (and every desync repair or segment load) produces new metadata, so unchanged
+    /// metadata means nothing was staged and the save is skipped - e.g. polling an empty or locked queue.
+    /// </summary>
+    private async Task CommitPopsAsync(ActorMetadata originalMetadata, ActorMetadata metadata)
+    {
+        if (ReferenceEquals(originalMetadata, metadata))
+        {
+            return;
+        }
+
+        await SetMetadataAsync(metadata);
+        await StateManager.SaveStateAsync();
+    }
+
     /// <summary>
     /// Internal Pop method that returns item JSON, priority, and response metadata.
     /// This is used by PopWithAck to track the original priority for expired lock restoration.
@@ -409,13 +462,14 @@ public class QueueActor : Actor, IQueueActor, IRemindable
     /// - response: Contains only metadata (Locked, IsEmpty, Message, LockExpiresAt)
     /// - priority: The priority level the item was popped from
     /// - itemJson: The JSON string of the popped item (null if none)
+    /// - metadata: The updated metadata. It is not staged here; the caller stages it once after all pops
     /// </summary>
+    /// <param name="metadata">Current metadata, threaded through successive pops in the same call</param>
     /// <param name="skipLockCheck">If true, skip the lock check (used for competing consumers)</param>
-    private async Task<(PopResponse response, int priority, string? itemJson, SinkConfig? sink)> PopWithPriorityAsync(bool skipLockCheck = false)
+    private async Task<(PopResponse response, int priority, string? itemJson, SinkConfig? sink, ActorMetadata metadata)> PopWithPriorityAsync(
+        ActorMetadata metadata,
+        bool skipLockCheck = false)
     {
-
-        var metadata = await GetMetadataAsync();
-
         try
         {
             // Check if queue is locked (any active lock blocks Pop)
@@ -429,20 +483,22 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                         Locked = true,
                         IsEmpty = false,
                         Message = "Queue is locked by another operation"
-                    }, -1, null, null);
+                    }, -1, null, null, metadata);
                 }
             }
 
             if (metadata.Queues.Count == 0)
             {
-                return (new PopResponse { Locked = false, IsEmpty = true }, -1, null, null);
+                return (new PopResponse { Locked = false, IsEmpty = true }, -1, null, null, metadata);
             }
 
-            // Find lowest priority with items
-            var sortedPriorities = metadata.Queues.Keys.OrderBy(p => p).ToList();
+            // Find lowest priority with items (ascending scan, no per-pop sort of the keys)
+            int? lastPriority = null;
 
-            foreach (var priority in sortedPriorities)
+            while (TryGetNextPriority(metadata.Queues, lastPriority, out int priority))
             {
+                lastPriority = priority;
+
                 // Load any offloaded segments that are needed
                 metadata = await CheckAndLoadSegmentsAsync(priority, metadata);
 
@@ -451,32 +507,35 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 if (queueMeta.Count == 0) continue;
 
                 int headSegment = queueMeta.HeadSegment;
+                int headIndex = queueMeta.HeadIndex;
                 int tailSegment = queueMeta.TailSegment;
                 int count = queueMeta.Count;
 
                 // Get head segment
-                string segmentKey = $"queue_{priority}_seg_{headSegment}";
-                var segment = await StateManager.TryGetStateAsync<Queue<QueueSegmentItem>>(segmentKey);
+                string segmentKey = SegmentKey(priority, headSegment);
+                var segment = await StateManager.TryGetStateAsync<List<QueueSegmentItem>>(segmentKey);
 
-                if (!segment.HasValue || segment.Value.Count == 0)
+                if (!segment.HasValue || segment.Value.Count <= headIndex)
                 {
                     // Defensive: fix count desync
-                    Logger.LogWarning($"Count desync detected for priority {priority}, removing queue metadata");
+                    Logger.LogWarning("Count desync detected for priority {Priority}, removing queue metadata", priority);
                     var updatedQueues = new Dictionary<int, QueueMetadata>(metadata.Queues);
                     updatedQueues.Remove(priority);
                     metadata = metadata with { Queues = updatedQueues };
-                    await SetMetadataAsync(metadata);
                     continue;
                 }
 
-                // Pop single item from front (FIFO)
-                var segmentQueue = segment.Value;
-                var segmentItem = segmentQueue.Dequeue();
+                // Pop single item from front (FIFO) by advancing the head index.
+                // The segment itself is left untouched until it is fully consumed, so a pop only
+                // re-writes metadata instead of re-serializing the rest of the segment.
+                var segmentItems = segment.Value;
+                var segmentItem = segmentItems[headIndex];
                 var itemJson = segmentItem.ItemJson;
                 var sink = segmentItem.Sink;
+                headIndex++;
 
                 // Handle segment cleanup
-                if (segmentQueue.Count == 0)
+                if (headIndex == segmentItems.Count)
                 {
                     if (headSegment < tailSegment)
                     {
@@ -492,21 +551,22 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                         queueMeta = queueMeta with
                         {
                             HeadSegment = headSegment,
+                            HeadIndex = 0,
                             TailSegment = tailSegment,
                             Count = count
                         };
                         metadata = metadata with { Queues = new Dictionary<int, QueueMetadata>(metadata.Queues) { [priority] = queueMeta } };
-                        await SetMetadataAsync(metadata);
 
-                        Logger.LogDebug($"[HEAD-ADVANCE] Actor {Id.GetId()}, Priority {priority}: " +
-                            $"headSegment advancing from {oldHeadSegment} to {headSegment}, " +
-                            $"tailSegment={tailSegment}, count={count}, " +
-                            $"offloadedRange=({queueMeta.HeadOffloadedSegment}, {queueMeta.TailOffloadedSegment})");
+                        Logger.LogDebug(
+                            "[HEAD-ADVANCE] Actor {ActorId}, Priority {Priority}: headSegment advancing from {OldHeadSegment} to {HeadSegment}, " +
+                            "tailSegment={TailSegment}, count={Count}, offloadedRange=({HeadOffloadedSegment}, {TailOffloadedSegment})",
+                            Id.GetId(), priority, oldHeadSegment, headSegment,
+                            tailSegment, count, queueMeta.HeadOffloadedSegment, queueMeta.TailOffloadedSegment);
 
-                        Logger.LogDebug($"Popped item from priority {priority}, count now {count}");
+                        Logger.LogDebug("Popped item from priority {Priority}, count now {Count}", priority, count);
 
                         // Return item JSON string directly with priority
-                        return (new PopResponse { Locked = false, IsEmpty = false }, priority, itemJson, sink);
+                        return (new PopResponse { Locked = false, IsEmpty = false }, priority, itemJson, sink, metadata);
                     }
                     else
                     {
@@ -517,36 +577,34 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                         var updatedQueues = new Dictionary<int, QueueMetadata>(metadata.Queues);
                         updatedQueues.Remove(priority);
                         metadata = metadata with { Queues = updatedQueues };
-                        await SetMetadataAsync(metadata);
 
-                        Logger.LogDebug($"Popped last item from priority {priority}, queue now empty");
+                        Logger.LogDebug("Popped last item from priority {Priority}, queue now empty", priority);
 
                         // Return item JSON string directly with priority
-                        return (new PopResponse { Locked = false, IsEmpty = false }, priority, itemJson, sink);
+                        return (new PopResponse { Locked = false, IsEmpty = false }, priority, itemJson, sink, metadata);
                     }
                 }
                 else
                 {
-                    // Segment still has items, save it
-                    await StateManager.SetStateAsync(segmentKey, segmentQueue);
+                    // Segment still has unconsumed items; only the head index moves
                     count--;
                     queueMeta = queueMeta with
                     {
                         HeadSegment = headSegment,
+                        HeadIndex = headIndex,
                         TailSegment = tailSegment,
                         Count = count
                     };
                     metadata = metadata with { Queues = new Dictionary<int, QueueMetadata>(metadata.Queues) { [priority] = queueMeta } };
-                    await SetMetadataAsync(metadata);
 
-                    Logger.LogDebug($"Popped item from priority {priority}, count now {count}");
+                    Logger.LogDebug("Popped item from priority {Priority}, count now {Count}", priority, count);
 
                     // Return item JSON string directly with priority
-                    return (new PopResponse { Locked = false, IsEmpty = false }, priority, itemJson, sink);
+                    return (new PopResponse { Locked = false, IsEmpty = false }, priority, itemJson, sink, metadata);
                 }
             }
 
-            return (new PopResponse { Locked = false, IsEmpty = true }, -1, null, null);
+            return (new PopResponse { Locked = false, IsEmpty = true }, -1, null, null, metadata);
         }
         catch (InvalidOperationException)
         {
@@ -556,10 +614,34 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         catch (Exception ex)
         {
             Logger.LogError(ex, "Error in PopAsync");
-            return (new PopResponse { Locked = false, IsEmpty = true }, -1, null, null);
+            return (new PopResponse { Locked = false, IsEmpty = true }, -1, null, null, metadata);
         }
     }
 
+    /// <summary>
+    /// Find the smallest priority greater than <paramref name="after"/> (or the smallest overall when null).
+    /// Queues hold only a handful of priorities, so a linear scan is cheaper than sorting on every pop.
+    /// </summary>
+    private static bool TryGetNextPriority(Dictionary<int, QueueMetadata> queues, int? after, out int priority)
+    {
+        bool found = false;
+        priority = 0;
+
+        foreach (int key in queues.Keys)
+        {
+            if (after.HasValue && key <= after.Value)
+                continue;
+
+            if (!found || key < priority)
+            {
+                priority = key;
+                found = true;
+            }
+        }
+
+        return found;
+    }
+
     // Helper methods follow in next section...
 
     private async Task<ActorMetadata> GetMetadataAsync()
@@ -582,20 +664,23 @@ public class QueueActor : Actor, IQueueActor, IRemindable
     {
         try
         {
-            if (reminderName.StartsWith("lock-"))
+            if (reminderName.StartsWith(LockReminderPrefix, StringComparison.Ordinal))
             {
-                string lockId = reminderName[5..];
+                string lockId = reminderName[LockReminderPrefix.Length..];
+                string lockKey = LockStateKey(lockId);
                 Logger.LogDebug("Reminder fired for lock {LockId}, re-queueing item", lockId);
 
                 // Retrieve lock state to get item and priority
-                var lockState = await StateManager.TryGetStateAsync<LockState>($"{lockId}-lock");
+                var lockState = await StateManager.TryGetStateAsync<LockState>(lockKey);
 
                 if (lockState.HasValue)
                 {
                     // Re-queue the item at original priority using PushInternal (stages without saving)
+                    var metadata = await GetMetadataAsync();
                     try
                     {
-                        bool success = await PushInternal(lockState.Value.ItemJson, lockState.Value.Priority, lockState.Value.Sink);
+                        bool success;
+                        (success, metadata) = await PushInternal(metadata, lockState.Value.ItemJson, lockState.Value.Priority, lockState.Value.Sink);
 
                         if (!success)
                         {
@@ -623,10 +708,9 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                     }
 
                     // Stage lock removal and metadata update (only after successful re-queue)
-                    await StateManager.RemoveStateAsync($"{lockId}-lock");
+                    await StateManager.RemoveStateAsync(lockKey);
 
-                    // Decrement lock counter
-                    var metadata = await GetMetadataAsync();
+                    // Decrement lock counter (metadata already carries the re-queued item)
                     await SetMetadataAsync(metadata with { LockCount = metadata.LockCount - 1 });
 
                     // Single atomic save: push + lock cleanup + metadata update
@@ -700,9 +784,20 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
             // Competing consumer mode: proceed regardless of existing locks
 
+            // Fast path for idle polling: no priority queues means nothing to lock
+            if (metadata.Queues.Count == 0)
+            {
+                return new PopWithAckResponse
+                {
+                    Locked = false,
+                    IsEmpty = true,
+                    Message = "Queue is empty"
+                };
+            }
+
             // Pop multiple items and create locks
-            var lockedItems = new List<PopWithAckItem>();
-            var newLockIds = new List<string>();
+            var lockedItems = new List<PopWithAckItem>(count);
+            var originalMetadata = metadata;
             double nowUnix = DateTimeOffset.UtcNow.ToUnixTimeSeconds();
             double lockExpiresAt = nowUnix + ttlSeconds;
 
@@ -710,7 +805,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             {
                 // Dequeue item (removes from queue) and store in lock
                 // Skip lock check to allow parallel locks
-                var (popResult, priority, itemJson, sink) = await PopWithPriorityAsync(skipLockCheck: true);
+                (_, int priority, string? itemJson, SinkConfig? sink, metadata) = await PopWithPriorityAsync(metadata, skipLockCheck: true);
 
                 // If queue is empty, return partial results
                 if (itemJson == null)
@@ -733,12 +828,9 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                     Sink = sink
                 };
 
-                await StateManager.SetStateAsync($"{lockId}-lock", lockData);
-
-                // Track lock ID for reminder registration
-                newLockIds.Add(lockId);
+                await StateManager.SetStateAsync(LockStateKey(lockId), lockData);
 
-                // Add to response items
+                // Add to response items (also drives reminder registration below)
                 lockedItems.Add(new PopWithAckItem
                 {
                     ItemJson = itemJson,
@@ -754,6 +846,8 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             // Check if we got any items
             if (lockedItems.Count == 0)
             {
+                // Persist any count-desync repair made while searching for an item
+                await CommitPopsAsync(originalMetadata, metadata);
                 return new PopWithAckResponse
                 {
                     Locked = false,
@@ -762,20 +856,20 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 };
             }
 
-            // Re-fetch metadata to get staged updates from pop loop (count decrements, headSegment advancements)
-            metadata = await GetMetadataAsync();
+            // Metadata already carries the pop loop's updates (count decrements, headSegment advancements)
             // Save all state atomically - increment lock counter
             metadata = metadata with { LockCount = metadata.LockCount + lockedItems.Count };
             await SetMetadataAsync(metadata);
             await StateManager.SaveStateAsync();
 
             // Register reminders for auto-expiry (gracefully degrades if scheduler unavailable)
-            foreach (var lockId in newLockIds)
+            foreach (var lockedItem in lockedItems)
             {
+                string lockId = lockedItem.LockId;
                 try
                 {
                     await RegisterReminderAsync(
-                        $"lock-{lockId}",
+                        LockReminderName(lockId),
                         null,
                         TimeSpan.FromSeconds(ttlSeconds),
                         TimeSpan.FromMilliseconds(-1)); // -1 means fire once
@@ -788,7 +882,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 }
             }
 
-            Logger.LogInformation("Created {Count} locks with TTL {TtlSeconds}s, expires at {LockExpiresAt}", lockedItems.Count, ttlSeconds, lockExpiresAt);
+            Logger.LogDebug("Created {Count} locks with TTL {TtlSeconds}s, expires at {LockExpiresAt}", lockedItems.Count, ttlSeconds, lockExpiresAt);
 
             return new PopWithAckResponse
             {
@@ -829,9 +923,10 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             }
 
             string lockId = request.LockId;
+            string lockKey = LockStateKey(lockId);
 
             // Get lock state
-            var lockState = await StateManager.TryGetStateAsync<LockState>($"{lockId}-lock");
+            var lockState = await StateManager.TryGetStateAsync<LockState>(lockKey);
             if (!lockState.HasValue)
             {
                 return new AcknowledgeResponse
@@ -844,7 +939,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
             // Note: Item already dequeued during PopWithAck - just remove lock state
             // Remove lock and decrement counter
-            await StateManager.RemoveStateAsync($"{lockId}-lock");
+            await StateManager.RemoveStateAsync(lockKey);
 
             var metadata = await GetMetadataAsync();
             await SetMetadataAsync(metadata with { LockCount = metadata.LockCount - 1 });
@@ -854,7 +949,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             // Unregister reminder (best effort - may not exist if scheduler unavailable)
             try
             {
-                await UnregisterReminderAsync($"lock-{lockId}");
+                await UnregisterReminderAsync(LockReminderName(lockId));
                 Logger.LogDebug("Unregistered reminder for lock {LockId}", lockId);
             }
             catch (Exception ex)
@@ -863,7 +958,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 Logger.LogDebug(ex, "Failed to unregister reminder for lock {LockId}", lockId);
             }
 
-            Logger.LogDebug($"Acknowledged lock {lockId}, 1 item processed");
+            Logger.LogDebug("Acknowledged lock {LockId}, 1 item processed", lockId);
 
             return new AcknowledgeResponse
             {
@@ -913,9 +1008,10 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             }
 
             string lockId = request.LockId;
+            string lockKey = LockStateKey(lockId);
 
             // Get lock state
-            var lockState = await StateManager.TryGetStateAsync<LockState>($"{lockId}-lock");
+            var lockState = await StateManager.TryGetStateAsync<LockState>(lockKey);
             if (!lockState.HasValue)
             {
                 return new ExtendLockResponse
@@ -947,13 +1043,14 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
             // Update lock state with new expiry
             var updatedLock = lockData with { ExpiresAt = newExpiresAt };
-            await StateManager.SetStateAsync($"{lockId}-lock", updatedLock);
+            await StateManager.SetStateAsync(lockKey, updatedLock);
             await StateManager.SaveStateAsync();
 
             // Update reminder with new TTL (best effort)
+            string reminderName = LockReminderName(lockId);
             try
             {
-                await UnregisterReminderAsync($"lock-{lockId}");
+                await UnregisterReminderAsync(reminderName);
             }
             catch (Exception ex)
             {
@@ -966,7 +1063,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 if (newTtlSeconds > 0)
                 {
                     await RegisterReminderAsync(
-                        $"lock-{lockId}",
+                        reminderName,
                         null,
                         TimeSpan.FromSeconds(newTtlSeconds),
                         TimeSpan.FromMilliseconds(-1)); // -1 means fire once
@@ -978,7 +1075,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 Logger.LogDebug(ex, "Failed to register updated reminder for lock {LockId}", lockId);
             }
 
-            Logger.LogDebug($"Extended lock {lockId} by {request.AdditionalTtlSeconds}s, new expiry: {newExpiresAt}");
+            Logger.LogDebug("Extended lock {LockId} by {AdditionalTtlSeconds}s, new expiry: {NewExpiresAt}", lockId, request.AdditionalTtlSeconds, newExpiresAt);
 
             return new ExtendLockResponse
             {
@@ -1017,9 +1114,10 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             }
 
             string lockId = request.LockId;
+            string lockKey = LockStateKey(lockId);
 
             // Get lock state
-            var lockState = await StateManager.TryGetStateAsync<LockState>($"{lockId}-lock");
+            var lockState = await StateManager.TryGetStateAsync<LockState>(lockKey);
             if (!lockState.HasValue)
             {
                 return new DeadLetterResponse
@@ -1049,7 +1147,6 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             string itemJson = lockData.ItemJson;
 
             // Push to DLQ using actor invoker (enables testing)
-            string dlqActorId = $"{Id.GetId()}-deadletter";
             var pushRequest = new PushRequest
             {
                 Items = new List<PushItem>
@@ -1063,7 +1160,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             };
 
             var pushResult = await _actorInvoker.InvokeMethodAsync<PushRequest, PushResponse>(
-                new ActorId(dlqActorId),
+                _deadLetterActorId,
                 "Push",
                 pushRequest);
 
@@ -1079,7 +1176,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
             // Successfully pushed to DLQ - item already removed from main queue during PopWithAck
             // Remove lock and decrement counter
-            await StateManager.RemoveStateAsync($"{lockId}-lock");
+            await StateManager.RemoveStateAsync(lockKey);
 
             var metadata = await GetMetadataAsync();
             await SetMetadataAsync(metadata with { LockCount = metadata.LockCount - 1 });
@@ -1089,7 +1186,7 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             return new DeadLetterResponse
             {
                 Status = "SUCCESS",
-                DlqId = dlqActorId,
+                DlqId = _deadLetterActorId.GetId(),
                 Message = "Item moved to dead letter queue and removed from main queue"
             };
         }
@@ -1108,23 +1205,10 @@ public class QueueActor : Actor, IQueueActor, IRemindable
     /// <summary>
     /// Generate a cryptographically secure 11-character alphanumeric lock ID.
     /// </summary>
-    private string GenerateLockId()
+    private static string GenerateLockId()
     {
-        // Generate 11-character alphanumeric string 
-        const string chars = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789";
-        var bytes = new byte[LockIdLength];
-        using (var rng = RandomNumberGenerator.Create())
-        {
-            rng.GetBytes(bytes);
-        }
-
-        var result = new StringBuilder(LockIdLength);
-        foreach (var b in bytes)
-        {
-            result.Append(chars[b % chars.Length]);
-        }
-
-        return result.ToString();
+        // Draws straight from the shared CSPRNG into the result string (no RNG instance, byte buffer or builder)
+        return RandomNumberGenerator.GetString(LockIdChars, LockIdLength);
     }
 
     /// <summary>
@@ -1144,6 +1228,14 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         if (!metadata.Queues.TryGetValue(priority, out var queueMeta))
             return (null, null);
 
+        return GetOffloadedRange(queueMeta);
+    }
+
+    /// <summary>
+    /// Get offloaded segment range from queue metadata already looked up by the caller.
+    /// </summary>
+    private static (int? head, int? tail) GetOffloadedRange(QueueMetadata queueMeta)
+    {
         if (queueMeta.HeadOffloadedSegment.HasValue && queueMeta.TailOffloadedSegment.HasValue)
         {
             return (queueMeta.HeadOffloadedSegment.Value, queueMeta.TailOffloadedSegment.Value);
@@ -1225,15 +1317,15 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
     /// <summary>
     /// Offload a full segment to the external state store.
-    /// Returns updated metadata if successful, null otherwise (logs warning, doesn't throw).
+    /// Returns updated metadata (for the caller to stage) if successful, null otherwise (logs warning, doesn't throw).
     /// </summary>
-    private async Task<ActorMetadata?> OffloadSegmentAsync(int priority, int segmentNum, Queue<QueueSegmentItem> segmentData, ActorMetadata metadata)
+    private async Task<ActorMetadata?> OffloadSegmentAsync(int priority, int segmentNum, List<QueueSegmentItem> segmentData, ActorMetadata metadata)
     {
         try
         {
-            string segmentKey = $"queue_{priority}_seg_{segmentNum}";
+            string segmentKey = SegmentKey(priority, segmentNum);
 
-            Logger.LogDebug($"[OFFLOAD-START] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}");
+            Logger.LogDebug("[OFFLOAD-START] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}", Id.GetId(), segmentNum, priority);
 
             // Add to offloaded range in metadata
             var updatedMetadata = AddOffloadedSegment(metadata, priority, segmentNum);
@@ -1241,17 +1333,16 @@ public class QueueActor : Actor, IQueueActor, IRemindable
             // Unload from actor memory (stays in permanent store at same key)
             await StateManager.UnloadStateAsync(segmentKey);
 
-            // Save metadata (staging only - commit happens in caller)
-            await SetMetadataAsync(updatedMetadata);
+            // Metadata is returned, not staged - the caller stages it once before committing
 
-            Logger.LogDebug($"[OFFLOAD-SUCCESS] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}: Unloaded from actor memory");
+            Logger.LogDebug("[OFFLOAD-SUCCESS] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}: Unloaded from actor memory", Id.GetId(), segmentNum, priority);
 
             return updatedMetadata;
         }
         catch (Exception ex)
         {
-            Logger.LogWarning($"[OFFLOAD-FAILED] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}: " +
-                $"Failed to offload - {ex.Message}");
+            Logger.LogWarning("[OFFLOAD-FAILED] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}: Failed to offload - {Error}",
+                Id.GetId(), segmentNum, priority, ex.Message);
             return null;
         }
     }
@@ -1259,18 +1350,18 @@ public class QueueActor : Actor, IQueueActor, IRemindable
 
     /// <summary>
     /// Load an offloaded segment from state store back into actor state.
-    /// Returns updated metadata if successful, throws on error.
+    /// Returns updated metadata (for the caller to stage) if successful, throws on error.
     /// </summary>
     private async Task<ActorMetadata?> LoadOffloadedSegmentAsync(int priority, int segmentNum, ActorMetadata metadata)
     {
         try
         {
-            string segmentKey = $"queue_{priority}_seg_{segmentNum}";
+            string segmentKey = SegmentKey(priority, segmentNum);
 
-            Logger.LogDebug($"[LOAD-START] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}");
+            Logger.LogDebug("[LOAD-START] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}", Id.GetId(), segmentNum, priority);
 
             // Load segment from permanent store (Dapr hydrates automatically)
-            var segmentData = await StateManager.TryGetStateAsync<Queue<QueueSegmentItem>>(segmentKey);
+            var segmentData = await StateManager.TryGetStateAsync<List<QueueSegmentItem>>(segmentKey);
 
             if (!segmentData.HasValue || segmentData.Value == null || segmentData.Value.Count == 0)
             {
@@ -1282,23 +1373,22 @@ public class QueueActor : Actor, IQueueActor, IRemindable
                 await SetMetadataAsync(corruptedMetadata);
                 await StateManager.SaveStateAsync();  // Persist error state immediately
 
-                Logger.LogCritical($"[LOAD-MISSING] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}: {errorMsg}");
+                Logger.LogCritical("[LOAD-MISSING] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}: {ErrorMessage}", Id.GetId(), segmentNum, priority, errorMsg);
                 throw new InvalidOperationException(errorMsg);
             }
 
             // Remove from offloaded range
             var updatedMetadata = RemoveOffloadedSegment(metadata, priority, segmentNum);
 
-            // Save metadata (staging only - commit happens in caller)
-            await SetMetadataAsync(updatedMetadata);
+            // Metadata is returned, not staged - the caller stages it once before committing
 
-            Logger.LogDebug($"[LOAD-SUCCESS] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}: Loaded {segmentData.Value.Count} items from permanent store");
+            Logger.LogDebug("[LOAD-SUCCESS] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}: Loaded {ItemCount} items from permanent store", Id.GetId(), segmentNum, priority, segmentData.Value.Count);
 
             return updatedMetadata;
         }
         catch (Exception ex)
         {
-            Logger.LogError(ex, $"Failed to load offloaded segment {segmentNum} for priority {priority} (actor {Id.GetId()})");
+            Logger.LogError(ex, "Failed to load offloaded segment {SegmentNum} for priority {Priority} (actor {ActorId})", segmentNum, priority, Id.GetId());
             throw;  // Changed from return null - loading failures should be fatal
         }
     }
@@ -1307,49 +1397,61 @@ public class QueueActor : Actor, IQueueActor, IRemindable
     /// <summary>
     /// Check and offload eligible segments for a priority queue.
     /// Called after Push. Non-blocking - failures are logged but don't throw.
+    /// Only segments below the tail as it was before this Push are considered: segments written
+    /// by this Push are still staged and must not be unloaded before SaveStateAsync.
+    /// Returns updated metadata (including any segments offloaded before a failure).
     /// </summary>
-    private async Task CheckAndOffloadSegmentsAsync(int priority, ActorMetadata metadata)
+    private async Task<ActorMetadata> CheckAndOffloadSegmentsAsync(int priority, ActorMetadata metadata, ActorMetadata metadataBeforePush)
     {
         try
         {
-            if (!metadata.Queues.TryGetValue(priority, out var queueMeta))
-                return;
+            if (!metadata.Queues.TryGetValue(priority, out var queueMeta) ||
+                !metadataBeforePush.Queues.TryGetValue(priority, out var queueMetaBeforePush))
+                return metadata;
 
             int headSegment = queueMeta.HeadSegment;
-            int tailSegment = queueMeta.TailSegment;
+            int tailSegment = queueMetaBeforePush.TailSegment;
             int bufferSegments = GetBufferSegments(metadata);
-            var offloadedRange = GetOffloadedRange(metadata, priority);
+            var offloadedRange = GetOffloadedRange(queueMeta);
 
             // Calculate eligible segment range
             int minOffload = headSegment + bufferSegments + 1;
             int maxOffload = tailSegment;
 
-            Logger.LogDebug($"[OFFLOAD-CHECK] Actor {Id.GetId()}, Priority {priority}: " +
-                $"headSegment={headSegment}, tailSegment={tailSegment}, bufferSegments={bufferSegments}, " +
-                $"minOffload={minOffload}, maxOffload={maxOffload}, " +
-                $"offloadedRange=({offloadedRange.head}, {offloadedRange.tail})");
+            // Steady state: the queue is too short for any segment to sit between the buffer and the tail
+            if (minOffload >= maxOffload)
+                return metadata;
+
+            Logger.LogDebug(
+                "[OFFLOAD-CHECK] Actor {ActorId}, Priority {Priority}: headSegment={HeadSegment}, tailSegment={TailSegment}, " +
+                "bufferSegments={BufferSegments}, minOffload={MinOffload}, maxOffload={MaxOffload}, offloadedRange=({OffloadedHead}, {OffloadedTail})",
+                Id.GetId(), priority, headSegment, tailSegment,
+                bufferSegments, minOffload, maxOffload, offloadedRange.head, offloadedRange.tail);
 
             // Check each segment in range
             for (int segmentNum = minOffload; segmentNum < maxOffload; segmentNum++)
             {
-                // Skip if already offloaded
+                // Skip past the already-offloaded range (contiguous, so jump to its end)
                 if (offloadedRange.head != null && offloadedRange.tail != null)
                 {
                     if (segmentNum >= offloadedRange.head && segmentNum <= offloadedRange.tail)
+                    {
+                        segmentNum = offloadedRange.tail.Value;
                         continue;
+                    }
                 }
 
                 // Check if segment exists and is full
-                string segmentKey = $"queue_{priority}_seg_{segmentNum}";
-                var segment = await StateManager.TryGetStateAsync<Queue<QueueSegmentItem>>(segmentKey);
+                string segmentKey = SegmentKey(priority, segmentNum);
+                var segment = await StateManager.TryGetStateAsync<List<QueueSegmentItem>>(segmentKey);
 
                 if (segment.HasValue && segment.Value.Count == MaxSegmentSize)
                 {
                     bool alreadyOffloaded = (offloadedRange.head != null && offloadedRange.tail != null &&
                                             segmentNum >= offloadedRange.head && segmentNum <= offloadedRange.tail);
 
-                    Logger.LogDebug($"[OFFLOAD-ELIGIBLE] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}: " +
-                        $"Full={segment.Value.Count == MaxSegmentSize}, AlreadyOffloaded={alreadyOffloaded}");
+                    Logger.LogDebug("[OFFLOAD-ELIGIBLE] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}: Full={Full}, AlreadyOffloaded={AlreadyOffloaded}",
+                        Id.GetId(), segmentNum, priority, segment.Value.Count == MaxSegmentSize, alreadyOffloaded);
 
                     // Offload this segment (non-blocking on failure)
                     var updatedMetadata = await OffloadSegmentAsync(priority, segmentNum, segment.Value, metadata);
@@ -1362,8 +1464,10 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         }
         catch (Exception ex)
         {
-            Logger.LogWarning(ex, $"Error checking/offloading segments for priority {priority} (actor {Id.GetId()})");
+            Logger.LogWarning(ex, "Error checking/offloading segments for priority {Priority} (actor {ActorId})", priority, Id.GetId());
         }
+
+        return metadata;
     }
 
     /// <summary>
@@ -1373,11 +1477,11 @@ public class QueueActor : Actor, IQueueActor, IRemindable
     /// </summary>
     private async Task<ActorMetadata> CheckAndLoadSegmentsAsync(int priority, ActorMetadata metadata)
     {
-        var (head, tail) = GetOffloadedRange(metadata, priority);
-        if (head == null || tail == null)
+        if (!metadata.Queues.TryGetValue(priority, out var queueMeta))
             return metadata;
 
-        if (!metadata.Queues.TryGetValue(priority, out var queueMeta))
+        var (head, tail) = GetOffloadedRange(queueMeta);
+        if (head == null || tail == null)
             return metadata;
 
         int headSegment = queueMeta.HeadSegment;
@@ -1386,18 +1490,22 @@ public class QueueActor : Actor, IQueueActor, IRemindable
         // Calculate which segments should be loaded
         int maxOffloaded = headSegment + bufferSegments;
 
-        Logger.LogDebug($"[LOAD-CHECK] Actor {Id.GetId()}, Priority {priority}: " +
-            $"headSegment={headSegment}, bufferSegments={bufferSegments}, " +
-            $"maxOffloaded={maxOffloaded}, " +
-            $"offloadedRange=({head}, {tail})");
+        // Nothing offloaded has reached the buffer zone yet
+        if (head.Value > maxOffloaded)
+            return metadata;
+
+        Logger.LogDebug(
+            "[LOAD-CHECK] Actor {ActorId}, Priority {Priority}: headSegment={HeadSegment}, bufferSegments={BufferSegments}, " +
+            "maxOffloaded={MaxOffloaded}, offloadedRange=({OffloadedHead}, {OffloadedTail})",
+            Id.GetId(), priority, headSegment, bufferSegments, maxOffloaded, head, tail);
 
         // Load segments that are within the buffer zone (from head of offloaded range)
         for (int segmentNum = head.Value; segmentNum <= tail.Value; segmentNum++)
         {
             if (segmentNum <= maxOffloaded)
             {
-                Logger.LogDebug($"[LOAD-ELIGIBLE] Actor {Id.GetId()}, Segment {segmentNum}, Priority {priority}: " +
-                    $"segmentNum ({segmentNum}) <= maxOffloaded ({maxOffloaded}), attempting load");
+                Logger.LogDebug("[LOAD-ELIGIBLE] Actor {ActorId}, Segment {SegmentNum}, Priority {Priority}: segmentNum <= maxOffloaded ({MaxOffloaded}), attempting load",
+                    Id.GetId(), segmentNum, priority, maxOffloaded);
 
                 // LoadOffloadedSegmentAsync now throws on failure instead of returning null
                 metadata = await LoadOffloadedSegmentAsync(priority, segmentNum, metadata);
@@ -24,13 +24,14 @@ public class BulkPopTests(DaprTestFixture fixture)
         var queueId = $"{fixture.QueueId}-bulk10-{Guid.NewGuid():N}";
         var expectedIds = new List<int>();
 
+        var pushItems = new List<ApiPushItem>();
         for (int i = 0; i < 10; i++)
         {
             var itemElement = JsonSerializer.SerializeToElement(new { id = i, value = $"item-{i}" });
-            await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
-                new ApiPushRequest(new List<ApiPushItem> { new ApiPushItem(itemElement, Priority: 1) }));
+            pushItems.Add(new ApiPushItem(itemElement, Priority: 1));
             expectedIds.Add(i);
         }
+        await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push", new ApiPushRequest(pushItems));
 
         // Act - Bulk pop all 10 items
         var popRequest = new HttpRequestMessage(HttpMethod.Post, $"/queue/{queueId}/pop");
@@ -46,7 +47,7 @@ public class BulkPopTests(DaprTestFixture fixture)
         Assert.Equal(10, result.Items.Count);
 
         var actualIds = result.Items.Select(popItem =>
-            ((JsonElement)popItem.Item).GetProperty("id").GetInt32()).ToList();
+            JsonDocument.Parse(popItem.Item.Json).RootElement.GetProperty("id").GetInt32()).ToList();
         Assert.Equal(expectedIds, actualIds);
     }
 
@@ -87,7 +88,7 @@ public class BulkPopTests(DaprTestFixture fixture)
         Assert.Equal(5, result.Items!.Count);
 
         var actualIds = result.Items.Select(popItem =>
-            ((JsonElement)popItem.Item).GetProperty("id").GetInt32()).ToList();
+            JsonDocument.Parse(popItem.Item.Json).RootElement.GetProperty("id").GetInt32()).ToList();
         Assert.Equal(new[] { 0, 1, 10, 11, 20 }, actualIds);
     }
 
@@ -97,13 +98,10 @@ public class BulkPopTests(DaprTestFixture fixture)
         // Arrange - Push 5 items
         var queueId = $"{fixture.QueueId}-bulk-ack-{Guid.NewGuid():N}";
 
-        for (int i = 0; i < 5; i++)
-        {
-            await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
-                new ApiPushRequest(new List<ApiPushItem> {
-                    new ApiPushItem(JsonSerializer.SerializeToElement(new { id = i }), Priority: 1)
-                }));
-        }
+        await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
+            new ApiPushRequest(Enumerable.Range(0, 5)
+                .Select(i => new ApiPushItem(JsonSerializer.SerializeToElement(new { id = i }), Priority: 1))
+                .ToList()));
 
         // Act - Bulk pop with acknowledgement
         var popRequest = new HttpRequestMessage(HttpMethod.Post, $"/queue/{queueId}/pop");
@@ -135,13 +133,10 @@ public class BulkPopTests(DaprTestFixture fixture)
         // Arrange - Push and lock 3 items
         var queueId = $"{fixture.QueueId}-bulk-ack-multi-{Guid.NewGuid():N}";
 
-        for (int i = 0; i < 3; i++)
-        {
-            await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
-                new ApiPushRequest(new List<ApiPushItem> {
-                    new ApiPushItem(JsonSerializer.SerializeToElement(new { id = i }), Priority: 1)
-                }));
-        }
+        await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
+            new ApiPushRequest(Enumerable.Range(0, 3)
+                .Select(i => new ApiPushItem(JsonSerializer.SerializeToElement(new { id = i }), Priority: 1))
+                .ToList()));
 
         var popRequest = new HttpRequestMessage(HttpMethod.Post, $"/queue/{queueId}/pop");
         popRequest.Headers.Add("count", "3");
@@ -175,13 +170,10 @@ public class BulkPopTests(DaprTestFixture fixture)
         // Arrange - Push only 3 items
         var queueId = $"{fixture.QueueId}-partial-{Guid.NewGuid():N}";
 
-        for (int i = 0; i < 3; i++)
-        {
-            await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
-                new ApiPushRequest(new List<ApiPushItem> {
-                    new ApiPushItem(JsonSerializer.SerializeToElement(new { id = i }), Priority: 1)
-                }));
-        }
+        await fixture.ApiClient.PostAsJsonAsync($"/queue/{queueId}/push",
+            new ApiPushRequest(Enumerable.Range(0, 3)
+                .Select(i => new ApiPushItem(JsonSerializer.SerializeToElement(new { id = i }), Priority: 1))
+                .ToList()));
 
         // Act - Request 10 items but only 3 exist
         var popRequest = new HttpRequestMessage(HttpMethod.Post, $"/queue/{queueId}/pop");
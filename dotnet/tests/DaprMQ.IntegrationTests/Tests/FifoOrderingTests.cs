@@ -42,7 +42,7 @@ public class FifoOrderingTests(DaprTestFixture fixture)
         Assert.Equal(10, result.Items.Count);
 
         var actualIds = result.Items.Select(popItem =>
-            ((JsonElement)popItem.Item).GetProperty("id").GetInt32()).ToList();
+            JsonDocument.Parse(popItem.Item.Json).RootElement.GetProperty("id").GetInt32()).ToList();
 
         // Assert - Verify FIFO ordering
         Assert.Equal(expectedIds, actualIds);
@@ -79,7 +79,7 @@ public class FifoOrderingTests(DaprTestFixture fixture)
         Assert.Equal(100, result.Items.Count);
 
         var actualIds = result.Items.Select(popItem =>
-            ((JsonElement)popItem.Item).GetProperty("id").GetInt32()).ToList();
+            JsonDocument.Parse(popItem.Item.Json).RootElement.GetProperty("id").GetInt32()).ToList();
 
         // Assert - Verify FIFO ordering
         Assert.Equal(expectedIds, actualIds);
@@ -171,7 +171,7 @@ public class FifoOrderingTests(DaprTestFixture fixture)
             Assert.Equal(100, result.Items.Count);
 
             var batchIds = result.Items.Select(popItem =>
-                ((JsonElement)popItem.Item).GetProperty("id").GetInt32()).ToList();
+                JsonDocument.Parse(popItem.Item.Json).RootElement.GetProperty("id").GetInt32()).ToList();
             actualIds.AddRange(batchIds);
         }
 
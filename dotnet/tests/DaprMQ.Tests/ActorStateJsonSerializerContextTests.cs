@@ -0,0 +1,50 @@
+using System.Text.Json;
+using DaprMQ.Interfaces;
+
+namespace DaprMQ.Tests;
+
+/// <summary>
+/// Verifies the source-generated actor state metadata reads and writes state
+/// in the same shape as the reflection-based actor runtime options.
+/// </summary>
+public class ActorStateJsonSerializerContextTests
+{
+    [Fact]
+    public void ActorMetadata_RoundTrips_WithIntPriorityKeys()
+    {
+        // Arrange
+        var metadata = new ActorMetadata
+        {
+            Queues = new Dictionary<int, QueueMetadata>
+            {
+                [0] = new QueueMetadata { HeadSegment = 1, TailSegment = 3, Count = 250, HeadOffloadedSegment = 3, TailOffloadedSegment = 3 }
+            },
+            LockCount = 2
+        };
+
+        // Act
+        var json = JsonSerializer.Serialize(metadata, ActorStateJsonSerializerContext.Default.ActorMetadata);
+        var roundTripped = JsonSerializer.Deserialize(json, ActorStateJsonSerializerContext.Default.ActorMetadata);
+
+        // Assert
+        Assert.NotNull(roundTripped);
+        Assert.Equal(2, roundTripped.LockCount);
+        Assert.Equal(metadata.Queues[0], roundTripped.Queues[0]);
+        Assert.Null(roundTripped.ErrorMessage);
+        Assert.DoesNotContain("errorMessage", json);
+    }
+
+    [Fact]
+    public void QueueSegment_Serializes_CamelCaseAndSkipsNullSink()
+    {
+        // Arrange
+        var segment = new List<QueueSegmentItem>();
+        segment.Add(new QueueSegmentItem { ItemJson = "{\"id\":1}" });
+
+        // Act
+        var json = JsonSerializer.Serialize(segment, ActorStateJsonSerializerContext.Default.ListQueueSegmentItem);
+
+        // Assert
+        Assert.Equal("[{\"itemJson\":\"{\\u0022id\\u0022:1}\"}]", json);
+    }
+}
@@ -0,0 +1,62 @@
+using System.Text.Json;
+using DaprMQ.ApiServer.Models;
+
+namespace DaprMQ.Tests;
+
+/// <summary>
+/// Verifies the source-generated API model metadata binds request bodies and
+/// writes responses the same way the reflection-based MVC defaults did.
+/// </summary>
+public class ApiJsonSerializerContextTests
+{
+    [Fact]
+    public void ApiPushRequest_DeserializesCamelCaseBody_AppliesDefaults()
+    {
+        // Arrange
+        var json = "{\"items\":[{\"item\":{\"id\":1}},{\"item\":{\"id\":2},\"priority\":0,\"sink\":{\"daprPubSub\":{\"metadata\":{\"ttl\":\"60\"}}}}]}";
+
+        // Act
+        var request = JsonSerializer.Deserialize(json, ApiJsonSerializerContext.Default.ApiPushRequest);
+
+        // Assert
+        Assert.NotNull(request);
+        Assert.Equal(2, request.Items.Count);
+        Assert.Equal(1, request.Items[0].Priority);
+        Assert.Equal("{\"id\":1}", request.Items[0].Item.GetRawText());
+        Assert.Null(request.Items[0].Sink);
+        Assert.Equal(0, request.Items[1].Priority);
+        Assert.Equal("60", request.Items[1].Sink!.DaprPubSub!.Metadata!["ttl"]);
+    }
+
+    [Fact]
+    public void ApiExtendLockRequest_MissingTtl_UsesDefault()
+    {
+        // Act
+        var request = JsonSerializer.Deserialize("{\"lockId\":\"abc\"}", ApiJsonSerializerContext.Default.ApiExtendLockRequest);
+
+        // Assert
+        Assert.NotNull(request);
+        Assert.Equal("abc", request.LockId);
+        Assert.Equal(30, request.AdditionalTtlSeconds);
+    }
+
+    [Fact]
+    public void ApiPopWithAckResponse_Serializes_CamelCaseWithRawItem()
+    {
+        // Arrange
+        var response = new ApiPopWithAckResponse(
+            new List<ApiPopWithAckItem>
+            {
+                new ApiPopWithAckItem(new RawJson("{\"id\":1}"), 1, "lock-1", 1700000000.5)
+            },
+            Locked: true);
+
+        // Act
+        var json = JsonSerializer.Serialize(response, ApiJsonSerializerContext.Default.ApiPopWithAckResponse);
+
+        // Assert
+        Assert.Equal(
+            "{\"items\":[{\"item\":{\"id\":1},\"priority\":1,\"lockId\":\"lock-1\",\"lockExpiresAt\":1700000000.5,\"sink\":null}],\"locked\":true,\"message\":null}",
+            json);
+    }
+}
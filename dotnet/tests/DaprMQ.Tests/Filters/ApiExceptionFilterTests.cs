@@ -0,0 +1,39 @@
+using Microsoft.AspNetCore.Http;
+using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Mvc.Abstractions;
+using Microsoft.AspNetCore.Mvc.Filters;
+using Microsoft.AspNetCore.Routing;
+using Microsoft.Extensions.Logging;
+using Moq;
+using DaprMQ.ApiServer.Filters;
+using DaprMQ.ApiServer.Models;
+
+namespace DaprMQ.Tests.Filters;
+
+public class ApiExceptionFilterTests
+{
+    [Fact]
+    public void OnException_UnhandledException_Returns500WithApiErrorResponse()
+    {
+        // Arrange
+        var filter = new ApiExceptionFilter(new Mock<ILogger<ApiExceptionFilter>>().Object);
+        var routeData = new RouteData();
+        routeData.Values["queueId"] = "test-queue";
+        var actionContext = new ActionContext(new DefaultHttpContext(), routeData, new ActionDescriptor());
+        var context = new ExceptionContext(actionContext, new List<IFilterMetadata>())
+        {
+            Exception = new InvalidOperationException("Actor unavailable")
+        };
+
+        // Act
+        filter.OnException(context);
+
+        // Assert
+        Assert.True(context.ExceptionHandled);
+        var objectResult = Assert.IsType<ObjectResult>(context.Result);
+        Assert.Equal(500, objectResult.StatusCode);
+        var error = Assert.IsType<ApiErrorResponse>(objectResult.Value);
+        Assert.False(error.Success);
+        Assert.Equal("Internal error: Actor unavailable", error.Message);
+    }
+}
@@ -0,0 +1,77 @@
+using Dapr.Actors;
+using Dapr.Actors.Client;
+using Moq;
+using DaprMQ.Interfaces;
+
+namespace DaprMQ.Tests;
+
+/// <summary>
+/// Unit tests for QueueActorInvoker's per-actor-id proxy cache.
+/// </summary>
+public class QueueActorInvokerTests
+{
+    // Creating a proxy only builds a client; nothing is sent until a method is invoked
+    private static Mock<IActorProxyFactory> CreateMockProxyFactory()
+    {
+        var realFactory = new ActorProxyFactory();
+        var mockFactory = new Mock<IActorProxyFactory>();
+        mockFactory.Setup(f => f.Create(It.IsAny<ActorId>(), It.IsAny<string>(), It.IsAny<ActorProxyOptions>()))
+            .Returns((ActorId actorId, string actorType, ActorProxyOptions _) => realFactory.Create(actorId, actorType));
+        return mockFactory;
+    }
+
+    [Fact]
+    public void GetProxy_SameActorId_ReusesOneProxy()
+    {
+        // Arrange
+        var mockFactory = CreateMockProxyFactory();
+        var invoker = new QueueActorInvoker(mockFactory.Object, "QueueActor");
+
+        // Act
+        var first = invoker.GetProxy(new ActorId("queue-a"));
+        var second = invoker.GetProxy(new ActorId("queue-a"));
+        var third = invoker.GetProxy(new ActorId("queue-a"));
+
+        // Assert
+        Assert.Same(first, second);
+        Assert.Same(first, third);
+        Assert.Equal(1, invoker.CachedProxyCount);
+        mockFactory.Verify(f => f.Create(It.IsAny<ActorId>(), "QueueActor", It.IsAny<ActorProxyOptions>()), Times.Once);
+    }
+
+    [Fact]
+    public void GetProxy_MoreIdsThanLimit_EvictsToStayWithinBound()
+    {
+        // Arrange
+        var mockFactory = CreateMockProxyFactory();
+        var invoker = new QueueActorInvoker(mockFactory.Object, "QueueActor", maxCachedProxies: 2);
+
+        // Act
+        for (int i = 0; i < 5; i++)
+        {
+            invoker.GetProxy(new ActorId($"queue-{i}"));
+        }
+
+        // Assert - the cache never holds more than the limit, and the newest id stays cached
+        Assert.Equal(2, invoker.CachedProxyCount);
+        invoker.GetProxy(new ActorId("queue-4"));
+        mockFactory.Verify(f => f.Create(It.IsAny<ActorId>(), It.IsAny<string>(), It.IsAny<ActorProxyOptions>()), Times.Exactly(5));
+    }
+
+    [Fact]
+    public void GetProxy_EvictedId_IsRecreatedOnNextUse()
+    {
+        // Arrange
+        var mockFactory = CreateMockProxyFactory();
+        var invoker = new QueueActorInvoker(mockFactory.Object, "QueueActor", maxCachedProxies: 1);
+
+        // Act - queue-b evicts queue-a, so queue-a needs a fresh proxy
+        invoker.GetProxy(new ActorId("queue-a"));
+        invoker.GetProxy(new ActorId("queue-b"));
+        invoker.GetProxy(new ActorId("queue-a"));
+
+        // Assert
+        Assert.Equal(1, invoker.CachedProxyCount);
+        mockFactory.Verify(f => f.Create(It.Is<ActorId>(id => id.GetId() == "queue-a"), It.IsAny<string>(), It.IsAny<ActorProxyOptions>()), Times.Exactly(2));
+    }
+}
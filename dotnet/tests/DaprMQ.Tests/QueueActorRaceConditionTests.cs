@@ -32,14 +32,14 @@ public class QueueActorRaceConditionTests
                 return new ConditionalValue<LockState>(false, null);
             });
 
-        mock.Setup(m => m.TryGetStateAsync<Queue<QueueSegmentItem>>(It.IsAny<string>(), It.IsAny<CancellationToken>()))
+        mock.Setup(m => m.TryGetStateAsync<List<QueueSegmentItem>>(It.IsAny<string>(), It.IsAny<CancellationToken>()))
             .ReturnsAsync((string key, CancellationToken ct) =>
             {
-                if (stateData.ContainsKey(key) && stateData[key] is Queue<QueueSegmentItem> queue)
+                if (stateData.ContainsKey(key) && stateData[key] is List<QueueSegmentItem> segment)
                 {
-                    return new ConditionalValue<Queue<QueueSegmentItem>>(true, queue);
+                    return new ConditionalValue<List<QueueSegmentItem>>(true, segment);
                 }
-                return new ConditionalValue<Queue<QueueSegmentItem>>(false, null);
+                return new ConditionalValue<List<QueueSegmentItem>>(false, null);
             });
 
         mock.Setup(m => m.GetStateAsync<ActorMetadata>(It.IsAny<string>(), It.IsAny<CancellationToken>()))
@@ -45,15 +45,15 @@ public class QueueActorTests
                 return new ConditionalValue<string>(false, null);
             });
 
-        // Setup TryGetStateAsync for Queue<QueueSegmentItem> (segments)
-        mock.Setup(m => m.TryGetStateAsync<Queue<QueueSegmentItem>>(It.IsAny<string>(), It.IsAny<CancellationToken>()))
+        // Setup TryGetStateAsync for List<QueueSegmentItem> (segments)
+        mock.Setup(m => m.TryGetStateAsync<List<QueueSegmentItem>>(It.IsAny<string>(), It.IsAny<CancellationToken>()))
             .ReturnsAsync((string key, CancellationToken ct) =>
             {
-                if (stateData.ContainsKey(key) && stateData[key] is Queue<QueueSegmentItem> queue)
+                if (stateData.ContainsKey(key) && stateData[key] is List<QueueSegmentItem> segment)
                 {
-                    return new ConditionalValue<Queue<QueueSegmentItem>>(true, queue);
+                    return new ConditionalValue<List<QueueSegmentItem>>(true, segment);
                 }
-                return new ConditionalValue<Queue<QueueSegmentItem>>(false, null);
+                return new ConditionalValue<List<QueueSegmentItem>>(false, null);
             });
 
         // Setup TryGetStateAsync for List<string> (lock registry)
@@ -101,10 +101,10 @@ public class QueueActorTests
         return mock;
     }
 
-    private async Task<QueueActor> CreateActorAsync(Mock<IActorStateManager> mockStateManager)
+    private async Task<QueueActor> CreateActorAsync(Mock<IActorStateManager> mockStateManager, Mock<ActorTimerManager>? mockTimerManager = null)
     {
-        // Create mock timer manager that no-ops timer registration
-        var mockTimerManager = new Mock<ActorTimerManager>();
+        // Create mock timer manager that no-ops timer registration (callers may pass one to verify reminders)
+        mockTimerManager ??= new Mock<ActorTimerManager>();
         mockTimerManager.Setup(m => m.RegisterTimerAsync(It.IsAny<ActorTimer>()))
             .Returns(Task.CompletedTask);
 
@@ -208,6 +208,33 @@ public class QueueActorTests
         Assert.NotNull(result.ErrorMessage);
     }
 
+    [Fact]
+    public async Task PushAsync_StateStoreFailsMidPush_DiscardsStagedSegments()
+    {
+        // Arrange - priority 1 is staged before the priority 2 segment read fails
+        var mockStateManager = CreateMockStateManager();
+        mockStateManager.Setup(m => m.TryGetStateAsync<List<QueueSegmentItem>>("queue_2_seg_0", It.IsAny<CancellationToken>()))
+            .ThrowsAsync(new TimeoutException("state store unavailable"));
+        var actor = await CreateActorAsync(mockStateManager);
+        var request = new Interfaces.PushRequest
+        {
+            Items = new List<Interfaces.PushItem>
+            {
+                new Interfaces.PushItem { ItemJson = "{\"id\":1}", Priority = 1 },
+                new Interfaces.PushItem { ItemJson = "{\"id\":2}", Priority = 2 }
+            }
+        };
+
+        // Act
+        var result = await actor.Push(request);
+
+        // Assert - nothing half-staged is left for the post-method save
+        Assert.False(result.Success);
+        Assert.Equal("state store unavailable", result.ErrorMessage);
+        mockStateManager.Verify(m => m.ClearCacheAsync(It.IsAny<CancellationToken>()), Times.Once);
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.Never);
+    }
+
     [Fact]
     public async Task PushAsync_WithEmptyItemJson_ReturnsFalure()
     {
@@ -326,6 +353,75 @@ public class QueueActorTests
         }
     }
 
+    [Fact]
+    public async Task Pop_PartiallyConsumedSegment_AdvancesHeadIndexWithoutRewritingSegment()
+    {
+        // Arrange
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        await actor.Push(new Interfaces.PushRequest
+        {
+            Items = new List<Interfaces.PushItem>
+            {
+                new Interfaces.PushItem { ItemJson = "{\"id\":0}", Priority = 1 },
+                new Interfaces.PushItem { ItemJson = "{\"id\":1}", Priority = 1 },
+                new Interfaces.PushItem { ItemJson = "{\"id\":2}", Priority = 1 }
+            }
+        });
+
+        // Act
+        var firstPop = await actor.Pop(new Interfaces.PopRequest { Count = 2 });
+
+        // Assert - only the head index moved; the segment was written once, by the push
+        Assert.Equal(new[] { "{\"id\":0}", "{\"id\":1}" }, firstPop.Items.Select(i => i.ItemJson));
+        var metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        Assert.Equal(2, metadata.Queues[1].HeadIndex);
+        Assert.Equal(1, metadata.Queues[1].Count);
+        mockStateManager.Verify(m => m.SetStateAsync("queue_1_seg_0", It.IsAny<object>(), It.IsAny<CancellationToken>()), Times.Once);
+
+        // FIFO order holds for items pushed after a partial drain
+        await actor.Push(new Interfaces.PushRequest
+        {
+            Items = new List<Interfaces.PushItem> { new Interfaces.PushItem { ItemJson = "{\"id\":3}", Priority = 1 } }
+        });
+        metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        Assert.Equal(0, metadata.Queues[1].HeadIndex); // consumed prefix compacted by the push
+        var secondPop = await actor.Pop(new Interfaces.PopRequest { Count = 3 });
+        Assert.Equal(new[] { "{\"id\":2}", "{\"id\":3}" }, secondPop.Items.Select(i => i.ItemJson));
+    }
+
+    [Fact]
+    public async Task Push_HeadIndexBeyondMissingSegment_ResetsHeadIndexSoItemIsPoppable()
+    {
+        // Arrange - head == tail with a consumed prefix, but the segment itself is missing (desync)
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        var metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        await mockStateManager.Object.SetStateAsync("metadata", metadata with
+        {
+            Queues = new Dictionary<int, QueueMetadata>
+            {
+                [1] = new QueueMetadata { HeadSegment = 0, HeadIndex = 2, TailSegment = 0, Count = 0 }
+            }
+        });
+
+        // Act
+        await actor.Push(new Interfaces.PushRequest
+        {
+            Items = new List<Interfaces.PushItem>
+            {
+                new Interfaces.PushItem { ItemJson = "{\"id\":1}", Priority = 1 }
+            }
+        });
+        var afterPush = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        var result = await actor.Pop(new Interfaces.PopRequest { Count = 1 });
+
+        // Assert - the head index no longer points past the pushed item
+        Assert.Equal(0, afterPush.Queues[1].HeadIndex);
+        var item = Assert.Single(result.Items);
+        Assert.Equal("{\"id\":1}", item.ItemJson);
+    }
+
     [Fact]
     public async Task PushAsync_WithOneInvalidItem_ReturnsFailureWithZeroItemsPushed()
     {
@@ -809,6 +905,181 @@ public class QueueActorTests
         Assert.False(fourthPop.Locked);
     }
 
+    [Fact]
+    public async Task PopWithAck_CountDesync_PersistsRepairWhenNothingLocked()
+    {
+        // Arrange - metadata claims an item at priority 1 but its segment is missing
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        var metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        await mockStateManager.Object.SetStateAsync("metadata", metadata with
+        {
+            Queues = new Dictionary<int, QueueMetadata> { [1] = new QueueMetadata { Count = 1 } }
+        });
+
+        // Act
+        var result = await actor.PopWithAck(new Interfaces.PopWithAckRequest { TtlSeconds = 30 });
+
+        // Assert - empty result, and the desynced queue entry is removed and saved
+        Assert.True(result.IsEmpty);
+        Assert.Empty(result.Items);
+        var repaired = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        Assert.False(repaired.Queues.ContainsKey(1));
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.AtLeastOnce);
+    }
+
+    [Fact]
+    public async Task Pop_NoPriorityQueues_ReturnsEmptyWithoutTouchingSegments()
+    {
+        // Arrange
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        mockStateManager.Invocations.Clear();
+
+        // Act
+        var result = await actor.Pop(new Interfaces.PopRequest { Count = 5 });
+
+        // Assert
+        Assert.True(result.IsEmpty);
+        Assert.False(result.Locked);
+        Assert.Empty(result.Items);
+        mockStateManager.Verify(m => m.TryGetStateAsync<List<QueueSegmentItem>>(It.IsAny<string>(), It.IsAny<CancellationToken>()), Times.Never);
+        mockStateManager.Verify(m => m.SetStateAsync(It.IsAny<string>(), It.IsAny<object>(), It.IsAny<CancellationToken>()), Times.Never);
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.Never);
+    }
+
+    [Fact]
+    public async Task Pop_EmptyAfterDrain_DoesNotSave()
+    {
+        // Arrange - a priority entry exists but holds nothing, so the pop loop runs and finds no item
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        var metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        await mockStateManager.Object.SetStateAsync("metadata", metadata with
+        {
+            Queues = new Dictionary<int, QueueMetadata> { [1] = new QueueMetadata { Count = 0 } }
+        });
+        mockStateManager.Invocations.Clear();
+
+        // Act
+        var result = await actor.Pop(new Interfaces.PopRequest { Count = 1 });
+
+        // Assert - nothing changed, so nothing is committed
+        Assert.True(result.IsEmpty);
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.Never);
+    }
+
+    [Fact]
+    public async Task Pop_LegacyLocked_DoesNotSave()
+    {
+        // Arrange - an item is queued behind an outstanding lock
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        await actor.Push(new Interfaces.PushRequest
+        {
+            Items = new List<Interfaces.PushItem>
+            {
+                new Interfaces.PushItem { ItemJson = "{\"id\":1}", Priority = 1 },
+                new Interfaces.PushItem { ItemJson = "{\"id\":2}", Priority = 1 }
+            }
+        });
+        await actor.PopWithAck(new Interfaces.PopWithAckRequest { TtlSeconds = 30 });
+        mockStateManager.Invocations.Clear();
+
+        // Act
+        var result = await actor.Pop(new Interfaces.PopRequest { Count = 1 });
+
+        // Assert
+        Assert.True(result.Locked);
+        Assert.Empty(result.Items);
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.Never);
+    }
+
+    [Fact]
+    public async Task Pop_ItemPopped_SavesOnce()
+    {
+        // Arrange
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        await actor.Push(new Interfaces.PushRequest
+        {
+            Items = new List<Interfaces.PushItem>
+            {
+                new Interfaces.PushItem { ItemJson = "{\"id\":1}", Priority = 1 },
+                new Interfaces.PushItem { ItemJson = "{\"id\":2}", Priority = 1 }
+            }
+        });
+        mockStateManager.Invocations.Clear();
+
+        // Act
+        var result = await actor.Pop(new Interfaces.PopRequest { Count = 1 });
+
+        // Assert
+        Assert.Single(result.Items);
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.Once);
+    }
+
+    [Fact]
+    public async Task PopWithAck_NoPriorityQueues_ReturnsEmptyWithoutLockOrReminder()
+    {
+        // Arrange
+        var mockStateManager = CreateMockStateManager();
+        var mockTimerManager = new Mock<ActorTimerManager>();
+        var actor = await CreateActorAsync(mockStateManager, mockTimerManager);
+        mockStateManager.Invocations.Clear();
+
+        // Act
+        var result = await actor.PopWithAck(new Interfaces.PopWithAckRequest { TtlSeconds = 30, Count = 5 });
+
+        // Assert
+        Assert.True(result.IsEmpty);
+        Assert.False(result.Locked);
+        Assert.Empty(result.Items);
+        mockStateManager.Verify(m => m.SetStateAsync(It.Is<string>(k => k.EndsWith("-lock")), It.IsAny<object>(), It.IsAny<CancellationToken>()), Times.Never);
+        mockStateManager.Verify(m => m.SaveStateAsync(It.IsAny<CancellationToken>()), Times.Never);
+        mockTimerManager.Verify(m => m.RegisterReminderAsync(It.IsAny<ActorReminder>()), Times.Never);
+    }
+
+    [Fact]
+    public async Task PopWithAck_NoPriorityQueues_MaxConcurrencyReachedTakesPrecedence()
+    {
+        // Arrange
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        var metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        await mockStateManager.Object.SetStateAsync("metadata", metadata with { LockCount = 2 });
+
+        // Act
+        var result = await actor.PopWithAck(new Interfaces.PopWithAckRequest
+        {
+            TtlSeconds = 30,
+            AllowCompetingConsumers = true,
+            MaxConcurrency = 2
+        });
+
+        // Assert
+        Assert.True(result.MaxConcurrencyReached);
+        Assert.False(result.IsEmpty);
+    }
+
+    [Fact]
+    public async Task PopWithAck_NoPriorityQueues_LegacyLockTakesPrecedence()
+    {
+        // Arrange
+        var mockStateManager = CreateMockStateManager();
+        var actor = await CreateActorAsync(mockStateManager);
+        var metadata = await mockStateManager.Object.GetStateAsync<ActorMetadata>("metadata");
+        await mockStateManager.Object.SetStateAsync("metadata", metadata with { LockCount = 1 });
+
+        // Act
+        var result = await actor.PopWithAck(new Interfaces.PopWithAckRequest { TtlSeconds = 30 });
+
+        // Assert
+        Assert.True(result.Locked);
+        Assert.False(result.IsEmpty);
+        Assert.Equal("Queue is locked by another operation", result.Message);
+    }
+
     [Fact]
     public async Task PopWithAck_CommitsAtomically()
     {
@@ -1,10 +1,16 @@
 using System.Text.Json;
 using Dapr.Actors;
+using Microsoft.AspNetCore.Http;
 using Microsoft.AspNetCore.Mvc;
+using Microsoft.AspNetCore.Mvc.Abstractions;
+using Microsoft.AspNetCore.Mvc.Filters;
+using Microsoft.AspNetCore.Routing;
 using Microsoft.Extensions.Logging;
 using Moq;
 using DaprMQ.ApiServer.Controllers;
+using DaprMQ.ApiServer.Filters;
 using DaprMQ.ApiServer.Models;
+using DaprMQ.ApiServer.Services;
 using DaprMQ.Interfaces;
 
 namespace DaprMQ.Tests;
@@ -38,7 +44,7 @@ public class QueueControllerTests
                 It.IsAny<CancellationToken>()))
             .ReturnsAsync(new PushResponse { Success = true, ItemsPushed = 1 });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var itemElement = JsonSerializer.SerializeToElement(new { id = 1, value = "test" });
         var request = new ApiPushRequest(new List<ApiPushItem>
         {
@@ -67,7 +73,7 @@ public class QueueControllerTests
                 It.IsAny<CancellationToken>()))
             .ReturnsAsync(new PushResponse { Success = true, ItemsPushed = 3 });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var item1 = JsonSerializer.SerializeToElement(new { id = 1 });
         var item2 = JsonSerializer.SerializeToElement(new { id = 2 });
         var item3 = JsonSerializer.SerializeToElement(new { id = 3 });
@@ -94,7 +100,7 @@ public class QueueControllerTests
     {
         // Arrange
         var mockInvoker = new Mock<IQueueActorInvoker>();
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiPushRequest(new List<ApiPushItem>());
 
         // Act
@@ -111,7 +117,7 @@ public class QueueControllerTests
     {
         // Arrange
         var mockInvoker = new Mock<IQueueActorInvoker>();
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiPushRequest(null!);
 
         // Act
@@ -128,7 +134,7 @@ public class QueueControllerTests
     {
         // Arrange
         var mockInvoker = new Mock<IQueueActorInvoker>();
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var itemElement = JsonSerializer.SerializeToElement(new { id = 1 });
         var request = new ApiPushRequest(new List<ApiPushItem>
         {
@@ -149,7 +155,7 @@ public class QueueControllerTests
     {
         // Arrange
         var mockInvoker = new Mock<IQueueActorInvoker>();
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         var items = new List<ApiPushItem>();
         for (int i = 0; i < 1001; i++)
@@ -209,7 +215,7 @@ public class QueueControllerTests
                 Message = "Item locked with ID test-lock-123"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: true, ttl_seconds: 30);
@@ -248,7 +254,7 @@ public class QueueControllerTests
                 Message = "Queue is locked by another operation"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: true, ttl_seconds: 30);
@@ -285,7 +291,7 @@ public class QueueControllerTests
                 Message = "Queue is empty"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: true, ttl_seconds: 30);
@@ -320,7 +326,7 @@ public class QueueControllerTests
                 LockExpiresAt = DateTimeOffset.UtcNow.AddSeconds(30).ToUnixTimeSeconds()
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: false);
@@ -357,7 +363,7 @@ public class QueueControllerTests
                 IsEmpty = false
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: false);
@@ -370,6 +376,87 @@ public class QueueControllerTests
         Assert.Equal(1, response.Items[0].Priority);
     }
 
+    /// <summary>
+    /// This test verifies that popped item JSON is written to the response verbatim.
+    ///
+    /// Expected behavior:
+    /// - Actor returns: Items=[{ItemJson="{\"id\":1,\"name\":\"a\"}", Priority=2}]
+    /// - Serialized ApiPopResponse embeds the item JSON as-is (not as a string)
+    /// </summary>
+    [Fact]
+    public async Task Pop_WithoutRequireAck_SerializesItemJsonVerbatim()
+    {
+        // Arrange
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        mockInvoker.Setup(i => i.InvokeMethodAsync<PopRequest, PopResponse>(
+                It.IsAny<ActorId>(),
+                "Pop",
+                It.IsAny<PopRequest>(),
+                It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new PopResponse
+            {
+                Items = new List<PopItem>
+                {
+                    new PopItem { ItemJson = "{\"id\":1,\"name\":\"a\"}", Priority = 2 }
+                },
+                Locked = false,
+                IsEmpty = false
+            });
+
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
+
+        // Act
+        var result = await controller.Pop("test-queue", require_ack: false);
+
+        // Assert
+        var okResult = Assert.IsType<OkObjectResult>(result);
+        var json = JsonSerializer.Serialize(okResult.Value, new JsonSerializerOptions(JsonSerializerDefaults.Web));
+        Assert.Equal("{\"items\":[{\"item\":{\"id\":1,\"name\":\"a\"},\"priority\":2}]}", json);
+    }
+
+    /// <summary>
+    /// Item JSON is written to the response verbatim, so invalid stored JSON must be
+    /// rejected inside the action, where ApiExceptionFilter maps it to a 500.
+    /// </summary>
+    [Fact]
+    public async Task Pop_StoredItemIsInvalidJson_Returns500ApiErrorResponse()
+    {
+        // Arrange
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        mockInvoker.Setup(i => i.InvokeMethodAsync<PopRequest, PopResponse>(
+                It.IsAny<ActorId>(),
+                "Pop",
+                It.IsAny<PopRequest>(),
+                It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new PopResponse
+            {
+                Items = new List<PopItem>
+                {
+                    new PopItem { ItemJson = "{\"id\":1", Priority = 1 }
+                },
+                Locked = false,
+                IsEmpty = false
+            });
+
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
+        var filter = new ApiExceptionFilter(new Mock<ILogger<ApiExceptionFilter>>().Object);
+
+        // Act - the action throws before any response is written; run it through the global filter
+        var exception = await Assert.ThrowsAnyAsync<JsonException>(() => controller.Pop("test-queue", require_ack: false));
+        var context = new ExceptionContext(
+            new ActionContext(new DefaultHttpContext(), new RouteData(), new ActionDescriptor()),
+            new List<IFilterMetadata>())
+        {
+            Exception = exception
+        };
+        filter.OnException(context);
+
+        // Assert
+        var objectResult = Assert.IsType<ObjectResult>(context.Result);
+        Assert.Equal(500, objectResult.StatusCode);
+        Assert.IsType<ApiErrorResponse>(objectResult.Value);
+    }
+
     /// <summary>
     /// This test verifies the expected behavior for Acknowledge with valid lock ID.
     ///
@@ -394,7 +481,7 @@ public class QueueControllerTests
                 ItemsAcknowledged = 1
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiAcknowledgeRequest("test-lock-123");
 
         // Act
@@ -432,7 +519,7 @@ public class QueueControllerTests
                 ItemsAcknowledged = 0
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiAcknowledgeRequest("expired-lock");
 
         // Act
@@ -468,7 +555,7 @@ public class QueueControllerTests
                 ItemsAcknowledged = 0
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiAcknowledgeRequest("invalid-lock");
 
         // Act
@@ -504,7 +591,7 @@ public class QueueControllerTests
                 ErrorMessage = null
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiExtendLockRequest("test-lock-123", AdditionalTtlSeconds: 30);
 
         // Act
@@ -542,7 +629,7 @@ public class QueueControllerTests
                 ErrorMessage = "Lock not found"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiExtendLockRequest("nonexistent-lock", AdditionalTtlSeconds: 30);
 
         // Act
@@ -577,7 +664,7 @@ public class QueueControllerTests
                 ErrorMessage = "Lock has expired"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiExtendLockRequest("expired-lock", AdditionalTtlSeconds: 30);
 
         // Act
@@ -613,7 +700,7 @@ public class QueueControllerTests
                 ErrorMessage = "Invalid lock ID"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiExtendLockRequest("", AdditionalTtlSeconds: 30);
 
         // Act
@@ -647,7 +734,7 @@ public class QueueControllerTests
                 Message = "Item moved to dead letter queue"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiDeadLetterRequest("valid-lock-123");
 
         // Act
@@ -684,7 +771,7 @@ public class QueueControllerTests
                 Message = "No active lock found"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiDeadLetterRequest("nonexistent-lock");
 
         // Act
@@ -718,7 +805,7 @@ public class QueueControllerTests
                 Message = "Lock has expired"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiDeadLetterRequest("expired-lock");
 
         // Act
@@ -753,7 +840,7 @@ public class QueueControllerTests
                 Message = "Invalid lock ID provided"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
         var request = new ApiDeadLetterRequest("wrong-lock-id");
 
         // Act
@@ -794,7 +881,7 @@ public class QueueControllerTests
                 IsEmpty = false
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: false, count: 3);
@@ -818,7 +905,7 @@ public class QueueControllerTests
     {
         // Arrange
         var mockInvoker = new Mock<IQueueActorInvoker>();
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act - Request more than 100 items
         var result = await controller.Pop("test-queue", require_ack: false, count: 101);
@@ -839,7 +926,7 @@ public class QueueControllerTests
     {
         // Arrange
         var mockInvoker = new Mock<IQueueActorInvoker>();
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act - Request negative count
         var result = await controller.Pop("test-queue", require_ack: false, count: -1);
@@ -873,7 +960,7 @@ public class QueueControllerTests
                 Message = "Queue is empty"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: false, count: 10);
@@ -908,7 +995,7 @@ public class QueueControllerTests
                 LockExpiresAt = DateTimeOffset.UtcNow.AddSeconds(30).ToUnixTimeSeconds()
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: false, count: 5);
@@ -967,7 +1054,7 @@ public class QueueControllerTests
                 Message = "Items locked"
             });
 
-        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object);
+        var controller = new QueueController(_mockLogger.Object, mockInvoker.Object, _mockHttpSinkActorInvoker.Object, _mockActorProxyFactory.Object, new QueuePushBatcher(mockInvoker.Object));
 
         // Act
         var result = await controller.Pop("test-queue", require_ack: true, ttl_seconds: 30, count: 3);
@@ -0,0 +1,145 @@
+using Dapr.Actors;
+using Moq;
+using DaprMQ.ApiServer.Services;
+using DaprMQ.Interfaces;
+
+namespace DaprMQ.Tests;
+
+/// <summary>
+/// Unit tests for QueuePushBatcher to verify concurrent pushes to a queue
+/// are coalesced into shared actor calls without mixing up per-caller results.
+/// </summary>
+public class QueuePushBatcherTests
+{
+    private static List<PushItem> CreateItems(params string[] itemJson) =>
+        itemJson.Select(json => new PushItem { ItemJson = json, Priority = 1 }).ToList();
+
+    [Fact]
+    public async Task PushAsync_SinglePush_InvokesActorOnce()
+    {
+        // Arrange
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        mockInvoker.Setup(i => i.InvokeMethodAsync<PushRequest, PushResponse>(
+                It.IsAny<ActorId>(),
+                "Push",
+                It.IsAny<PushRequest>(),
+                It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new PushResponse { Success = true, ItemsPushed = 2 });
+        var batcher = new QueuePushBatcher(mockInvoker.Object);
+
+        // Act
+        var result = await batcher.PushAsync("test-queue", CreateItems("{\"id\":1}", "{\"id\":2}"));
+
+        // Assert
+        Assert.True(result.Success);
+        Assert.Equal(2, result.ItemsPushed);
+        mockInvoker.Verify(i => i.InvokeMethodAsync<PushRequest, PushResponse>(
+            It.Is<ActorId>(id => id.GetId() == "test-queue"),
+            "Push",
+            It.Is<PushRequest>(r => r.Items.Count == 2),
+            It.IsAny<CancellationToken>()), Times.Once);
+    }
+
+    [Fact]
+    public async Task PushAsync_PushesArrivingDuringInFlightCall_AreCoalescedInOrder()
+    {
+        // Arrange
+        var firstCallStarted = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+        var releaseFirstCall = new TaskCompletionSource(TaskCreationOptions.RunContinuationsAsynchronously);
+        var requests = new List<PushRequest>();
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        mockInvoker.Setup(i => i.InvokeMethodAsync<PushRequest, PushResponse>(
+                It.IsAny<ActorId>(),
+                "Push",
+                It.IsAny<PushRequest>(),
+                It.IsAny<CancellationToken>()))
+            .Returns(async (ActorId _, string _, PushRequest request, CancellationToken _) =>
+            {
+                lock (requests)
+                {
+                    requests.Add(request);
+                }
+
+                if (requests.Count == 1)
+                {
+                    firstCallStarted.SetResult();
+                    await releaseFirstCall.Task;
+                }
+
+                return new PushResponse { Success = true, ItemsPushed = request.Items.Count };
+            });
+        var batcher = new QueuePushBatcher(mockInvoker.Object);
+
+        // Act
+        var first = batcher.PushAsync("test-queue", CreateItems("{\"id\":1}"));
+        await firstCallStarted.Task;
+        var second = batcher.PushAsync("test-queue", CreateItems("{\"id\":2}", "{\"id\":3}"));
+        var third = batcher.PushAsync("test-queue", CreateItems("{\"id\":4}"));
+        releaseFirstCall.SetResult();
+        var results = await Task.WhenAll(first, second, third);
+
+        // Assert - two actor calls; the second carries both waiting pushes in arrival order
+        Assert.Equal(2, requests.Count);
+        Assert.Equal(
+            new[] { "{\"id\":2}", "{\"id\":3}", "{\"id\":4}" },
+            requests[1].Items.Select(i => i.ItemJson));
+        Assert.Equal(new[] { 1, 2, 1 }, results.Select(r => r.ItemsPushed));
+        Assert.All(results, r => Assert.True(r.Success));
+    }
+
+    [Fact]
+    public async Task PushAsync_ActorThrows_PropagatesException()
+    {
+        // Arrange
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        mockInvoker.Setup(i => i.InvokeMethodAsync<PushRequest, PushResponse>(
+                It.IsAny<ActorId>(),
+                "Push",
+                It.IsAny<PushRequest>(),
+                It.IsAny<CancellationToken>()))
+            .ThrowsAsync(new InvalidOperationException("actor unavailable"));
+        var batcher = new QueuePushBatcher(mockInvoker.Object);
+
+        // Act & Assert
+        var ex = await Assert.ThrowsAsync<InvalidOperationException>(
+            () => batcher.PushAsync("test-queue", CreateItems("{\"id\":1}")));
+        Assert.Equal("actor unavailable", ex.Message);
+    }
+
+    [Fact]
+    public void PushAsync_WhitespaceQueueId_ThrowsBeforeEnqueueing()
+    {
+        // Arrange
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        var batcher = new QueuePushBatcher(mockInvoker.Object);
+
+        // Act & Assert
+        Assert.ThrowsAny<ArgumentException>(() => batcher.PushAsync(" ", CreateItems("{\"id\":1}")));
+        mockInvoker.VerifyNoOtherCalls();
+    }
+
+    [Fact]
+    public async Task PushAsync_FlushFailsOutsideActorCall_FaultsCallerAndEvictsBatch()
+    {
+        // Arrange
+        var mockInvoker = new Mock<IQueueActorInvoker>();
+        mockInvoker.Setup(i => i.InvokeMethodAsync<PushRequest, PushResponse>(
+                It.IsAny<ActorId>(),
+                "Push",
+                It.IsAny<PushRequest>(),
+                It.IsAny<CancellationToken>()))
+            .ReturnsAsync(new PushResponse { Success = true, ItemsPushed = 1 });
+        var batcher = new QueuePushBatcher(mockInvoker.Object);
+
+        // Act - a null item list makes batch assembly throw inside the background flush
+        var failed = batcher.PushAsync("test-queue", null!);
+        var completed = await Task.WhenAny(failed, Task.Delay(TimeSpan.FromSeconds(5)));
+
+        // Assert - the caller faults instead of hanging, and the queue keeps accepting pushes
+        Assert.Same(failed, completed);
+        await Assert.ThrowsAsync<NullReferenceException>(() => failed);
+
+        var result = await batcher.PushAsync("test-queue", CreateItems("{\"id\":2}")).WaitAsync(TimeSpan.FromSeconds(5));
+        Assert.True(result.Success);
+    }
+}